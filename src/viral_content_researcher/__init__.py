@@ -6,8 +6,6 @@ __version__ = "1.0.0"
 __author__ = "Marketing Content Team"
 
 from viral_content_researcher.models import Topic, ContentBrief, TrendSource
-from viral_content_researcher.researcher import ViralContentResearcher
-from viral_content_researcher.curator import ContentCurator
 
 __all__ = [
     "Topic",
@@ -16,3 +14,21 @@ __all__ = [
     "ViralContentResearcher",
     "ContentCurator",
 ]
+
+# The researcher pulls in every scraper (aiohttp, feedparser, bs4, ...), so it
+# is resolved lazily to keep `import viral_content_researcher` cheap
+_LAZY_IMPORTS = {
+    "ViralContentResearcher": "viral_content_researcher.researcher",
+    "ContentCurator": "viral_content_researcher.curator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
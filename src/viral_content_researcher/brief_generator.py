@@ -2,195 +2,238 @@
 Content brief generator for creating actionable content plans
 """
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
 from typing import Optional
+import heapq
+import os
 import uuid
 
 from viral_content_researcher.models import Topic, ContentBrief, ContentCategory
 from viral_content_researcher.curator import ContentCurator
 
 
+class BriefFormat(str, Enum):
+    """Content formats a brief can be generated in"""
+    BLOG_POST = "blog_post"
+    GUIDE = "guide"
+    LISTICLE = "listicle"
+    TUTORIAL = "tutorial"
+    COMPARISON = "comparison"
+    CASE_STUDY = "case_study"
+    REVIEW = "review"
+    STRATEGY_GUIDE = "strategy_guide"
+
+
+# Outline list-item prefixes built once so the hot loop is plain concatenation
+_LIST_ITEM_PREFIXES = tuple(f"  - Item {i + 1}: [Related to " for i in range(10))
+
+# Weekday names indexed by date.weekday(); avoids locale-aware strftime
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Urgency levels indexed by virality-score bucket (score // 20)
+_URGENCY_BUCKETS = ("low", "low", "medium", "high", "trending_now", "trending_now")
+
+
+@lru_cache(maxsize=512)
+def _lower(s: str) -> str:
+    """Memoized str.lower; topic titles repeat across batch workflows"""
+    return s.lower()
+
+
+@lru_cache(maxsize=1024)
+def _title_variants_cached(base_title: str) -> tuple[str, ...]:
+    """Build title variants for a topic title; cached since the output is pure.
+
+    Only the first five variants are ever surfaced, so the format-specific
+    variants that used to be appended past the cutoff are no longer built.
+    """
+    return (
+        f"How to Master {base_title} in 2025",
+        f"The Complete Guide to {base_title}",
+        f"{base_title}: Everything You Need to Know",
+        f"Why {base_title} Matters (And How to Get Started)",
+        f"Top 10 {base_title} Strategies That Actually Work",
+    )
+
+
+@lru_cache(maxsize=1024)
+def _target_keywords_cached(title: str, keywords: tuple[str, ...]) -> tuple[str, ...]:
+    """Extract target keywords for a title; cached since the output is pure"""
+    result = list(keywords)
+    seen = set(result)
+
+    # Add topic title words, deduplicating via O(1) set membership
+    for word in title.lower().split():
+        if len(word) > 3 and word not in seen:
+            seen.add(word)
+            result.append(word)
+
+    return tuple(result[:10])
+
+
 class BriefGenerator:
     """
     Generates content briefs from trending topics.
     Creates actionable plans for content creation.
     """
 
+    __slots__ = ("curator",)
+
     # Content format templates
     FORMAT_TEMPLATES = {
         "blog_post": {
-            "sections": ["Introduction", "Main Points", "Examples", "Conclusion", "CTA"],
+            "sections": ("Introduction", "Main Points", "Examples", "Conclusion", "CTA"),
             "word_count": 1500,
         },
         "guide": {
-            "sections": ["Introduction", "Prerequisites", "Step-by-Step Guide", "Pro Tips", "Common Mistakes", "Conclusion"],
+            "sections": ("Introduction", "Prerequisites", "Step-by-Step Guide", "Pro Tips", "Common Mistakes", "Conclusion"),
             "word_count": 2500,
         },
         "listicle": {
-            "sections": ["Introduction", "List Items (7-10)", "Bonus Tips", "Conclusion"],
+            "sections": ("Introduction", "List Items (7-10)", "Bonus Tips", "Conclusion"),
             "word_count": 1500,
         },
         "tutorial": {
-            "sections": ["Overview", "What You'll Learn", "Step 1", "Step 2", "Step 3", "Testing", "Troubleshooting"],
+            "sections": ("Overview", "What You'll Learn", "Step 1", "Step 2", "Step 3", "Testing", "Troubleshooting"),
             "word_count": 2000,
         },
         "comparison": {
-            "sections": ["Introduction", "Overview of Options", "Feature Comparison", "Pros and Cons", "Verdict", "Recommendation"],
+            "sections": ("Introduction", "Overview of Options", "Feature Comparison", "Pros and Cons", "Verdict", "Recommendation"),
             "word_count": 1800,
         },
         "case_study": {
-            "sections": ["Executive Summary", "Background", "Challenge", "Solution", "Results", "Lessons Learned"],
+            "sections": ("Executive Summary", "Background", "Challenge", "Solution", "Results", "Lessons Learned"),
             "word_count": 2000,
         },
         "review": {
-            "sections": ["Introduction", "Overview", "Features", "Pros", "Cons", "Pricing", "Verdict"],
+            "sections": ("Introduction", "Overview", "Features", "Pros", "Cons", "Pricing", "Verdict"),
             "word_count": 1200,
         },
         "strategy_guide": {
-            "sections": ["Executive Summary", "Current Landscape", "Strategy Framework", "Implementation", "Metrics", "Next Steps"],
+            "sections": ("Executive Summary", "Current Landscape", "Strategy Framework", "Implementation", "Metrics", "Next Steps"),
             "word_count": 3000,
         },
     }
 
-    # Hook templates by category
+    # Fallback template bound once so the per-brief .get() call doesn't
+    # re-evaluate FORMAT_TEMPLATES["blog_post"]
+    _DEFAULT_TEMPLATE = FORMAT_TEMPLATES["blog_post"]
+
+    # Outline "plans" compiled once at class load: every section is classified
+    # and prefixed with "## " up front, so the per-brief loop only dispatches
+    # on kind and never re-scans section names or copies the section list
+    _OUTLINE_PLANS: dict[str, tuple[tuple[str, str], ...]] = {}
+    for _fmt, _tmpl in FORMAT_TEMPLATES.items():
+        _plan = []
+        for _s in _tmpl["sections"]:
+            if "List Items" in _s:
+                _plan.append(("list_items", "## " + _s))
+            elif "Step" in _s and _s != "Step-by-Step Guide":
+                _plan.append(("step", "## " + _s))
+            else:
+                _plan.append(("header", "## " + _s))
+        _OUTLINE_PLANS[_fmt] = tuple(_plan)
+    del _fmt, _tmpl, _plan, _s
+
+    # Hook templates by category, prebuilt as callables so generating a hook
+    # is a single f-string evaluation instead of repeated str.replace scans
     HOOK_TEMPLATES = {
         ContentCategory.SEO: [
-            "Here's the SEO strategy that generated {X}% more organic traffic",
-            "The {topic} technique top sites use (and you should too)",
-            "Why {topic} is the key to ranking higher in 2025",
+            lambda t: "Here's the SEO strategy that generated 250% more organic traffic",
+            lambda t: f"The {t} technique top sites use (and you should too)",
+            lambda t: f"Why {t} is the key to ranking higher in 2025",
         ],
         ContentCategory.SOCIAL_MEDIA: [
-            "How {topic} is changing social media marketing forever",
-            "The viral {topic} strategy that grew our audience 10x",
-            "{topic}: The social media secret brands don't want you to know",
+            lambda t: f"How {t} is changing social media marketing forever",
+            lambda t: f"The viral {t} strategy that grew our audience 10x",
+            lambda t: f"{t}: The social media secret brands don't want you to know",
         ],
         ContentCategory.CONTENT_MARKETING: [
-            "The {topic} framework that converts readers into customers",
-            "Content marketing breakthrough: How {topic} drives engagement",
-            "Why {topic} is the future of content strategy",
+            lambda t: f"The {t} framework that converts readers into customers",
+            lambda t: f"Content marketing breakthrough: How {t} drives engagement",
+            lambda t: f"Why {t} is the future of content strategy",
         ],
         ContentCategory.GROWTH_HACKING: [
-            "Growth hack: How {topic} can 10x your results",
-            "The unconventional {topic} strategy that went viral",
-            "{topic} - The growth lever you're probably ignoring",
+            lambda t: f"Growth hack: How {t} can 10x your results",
+            lambda t: f"The unconventional {t} strategy that went viral",
+            lambda t: f"{t} - The growth lever you're probably ignoring",
         ],
         ContentCategory.AI_MARKETING: [
-            "How AI is revolutionizing {topic} for marketers",
-            "The {topic} AI tool that's changing everything",
-            "{topic} + AI: The marketing combo you need to try",
+            lambda t: f"How AI is revolutionizing {t} for marketers",
+            lambda t: f"The {t} AI tool that's changing everything",
+            lambda t: f"{t} + AI: The marketing combo you need to try",
         ],
         ContentCategory.STARTUP: [
-            "Startup lessons: How {topic} led to product-market fit",
-            "The {topic} strategy every founder should know",
-            "From 0 to 1: How {topic} transformed our startup",
+            lambda t: f"Startup lessons: How {t} led to product-market fit",
+            lambda t: f"The {t} strategy every founder should know",
+            lambda t: f"From 0 to 1: How {t} transformed our startup",
         ],
     }
 
+    # Fallback hooks for categories without dedicated templates
+    DEFAULT_HOOKS = [
+        lambda t: f"Discover how {t} can transform your marketing strategy",
+    ]
+
+    # Same templates keyed by the category's plain string value, which hashes
+    # faster than the enum member on the per-brief lookup
+    _HOOKS_BY_VALUE = {_cat.value: _tmpls for _cat, _tmpls in HOOK_TEMPLATES.items()}
+
     def __init__(self, curator: Optional[ContentCurator] = None):
         self.curator = curator or ContentCurator()
 
     def _generate_hook(self, topic: Topic) -> str:
         """Generate an engaging hook for the content"""
-        templates = self.HOOK_TEMPLATES.get(
-            topic.category,
-            ["Discover how {topic} can transform your marketing strategy"]
-        )
+        templates = self._HOOKS_BY_VALUE.get(topic.category.value, self.DEFAULT_HOOKS)
 
         # Use first template (could randomize)
-        hook = templates[0].replace("{topic}", topic.title)
-        hook = hook.replace("{X}", "250")  # Placeholder number
-
-        return hook
-
-    def _generate_outline(self, topic: Topic, format_type: str) -> list[str]:
-        """Generate a content outline"""
-        template = self.FORMAT_TEMPLATES.get(format_type, self.FORMAT_TEMPLATES["blog_post"])
-        base_sections = template["sections"].copy()
+        return templates[0](topic.title)
 
+    def _generate_outline(self, topic: Topic, plan: tuple[tuple[str, str], ...]) -> list[str]:
+        """Generate a content outline from a precompiled format plan"""
         # Customize based on topic
         outline = []
-        for section in base_sections:
-            if "List Items" in section:
-                # Generate list items
-                outline.append(f"## {section}")
-                for i in range(7):
-                    outline.append(f"  - Item {i+1}: [Related to {topic.title}]")
-            elif "Step" in section and section != "Step-by-Step Guide":
-                outline.append(f"## {section}: [Action related to {topic.title}]")
-            else:
-                outline.append(f"## {section}")
+        for kind, header in plan:
+            if kind == "header":
+                outline.append(header)
+            elif kind == "step":
+                outline.append(f"{header}: [Action related to {topic.title}]")
+            else:  # list_items
+                outline.append(header)
+                outline.extend(pref + topic.title + "]" for pref in _LIST_ITEM_PREFIXES[:7])
 
         return outline
 
     def _extract_target_keywords(self, topic: Topic) -> list[str]:
         """Extract target keywords from topic"""
-        keywords = topic.keywords.copy() if topic.keywords else []
-
-        # Add topic title words
-        title_words = topic.title.lower().split()
-        for word in title_words:
-            if len(word) > 3 and word not in keywords:
-                keywords.append(word)
-
-        return keywords[:10]
+        return list(_target_keywords_cached(topic.title, tuple(topic.keywords or ())))
 
     def _generate_title_variants(self, topic: Topic, format_type: str) -> list[str]:
         """Generate alternative title options"""
-        base_title = topic.title
-
-        variants = [
-            f"How to Master {base_title} in 2025",
-            f"The Complete Guide to {base_title}",
-            f"{base_title}: Everything You Need to Know",
-            f"Why {base_title} Matters (And How to Get Started)",
-            f"Top 10 {base_title} Strategies That Actually Work",
-            f"{base_title} Explained: A Marketer's Guide",
-            f"The Ultimate {base_title} Playbook",
-        ]
-
-        # Add format-specific variants
-        if format_type == "listicle":
-            variants.extend([
-                f"7 {base_title} Tips You Need to Know",
-                f"10 {base_title} Mistakes to Avoid",
-            ])
-        elif format_type == "tutorial":
-            variants.extend([
-                f"Step-by-Step: {base_title} Tutorial for Beginners",
-                f"How to {base_title}: A Complete Walkthrough",
-            ])
-        elif format_type == "case_study":
-            variants.extend([
-                f"Case Study: How {base_title} Drove Results",
-                f"Real Results: Our {base_title} Journey",
-            ])
-
-        return variants[:5]
+        return list(_title_variants_cached(topic.title))
 
     def _generate_meta_description(self, topic: Topic, hook: str) -> str:
         """Generate SEO meta description"""
         # Keep under 160 characters
-        desc = f"Learn {topic.title.lower()}. {hook[:80]}"
+        desc = f"Learn {_lower(topic.title)}. {hook[:80]}"
         if len(desc) > 155:
             desc = desc[:152] + "..."
         return desc
 
     def _determine_urgency(self, topic: Topic) -> str:
         """Determine content urgency based on topic metrics"""
-        if topic.virality_score >= 80:
-            return "trending_now"
-        elif topic.virality_score >= 60:
-            return "high"
-        elif topic.virality_score >= 40:
-            return "medium"
-        else:
-            return "low"
+        return _URGENCY_BUCKETS[min(int(topic.virality_score) // 20, 5)]
 
     def generate_brief(
         self,
         topic: Topic,
         format_type: Optional[str] = None,
         notes: Optional[str] = None,
+        brief_id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
     ) -> ContentBrief:
         """
         Generate a content brief from a topic.
@@ -199,6 +242,8 @@ class BriefGenerator:
             topic: The source topic
             format_type: Override content format (auto-detected if None)
             notes: Additional notes for the brief
+            brief_id: Pre-generated brief ID (batch callers supply their own)
+            created_at: Timestamp shared across a batch (defaults to now)
 
         Returns:
             ContentBrief ready for content creation
@@ -206,12 +251,17 @@ class BriefGenerator:
         # Determine format
         if not format_type:
             format_type = self.curator.identify_content_format(topic)
+        elif isinstance(format_type, BriefFormat):
+            # str-mixin enum members hash by name, so normalize for dict lookups
+            format_type = format_type.value
 
-        template = self.FORMAT_TEMPLATES.get(format_type, self.FORMAT_TEMPLATES["blog_post"])
+        # Resolve the template and outline plan once; the helpers reuse them
+        template = self.FORMAT_TEMPLATES.get(format_type, self._DEFAULT_TEMPLATE)
+        plan = self._OUTLINE_PLANS.get(format_type) or self._OUTLINE_PLANS["blog_post"]
 
         # Generate components
         hook = self._generate_hook(topic)
-        outline = self._generate_outline(topic, format_type)
+        outline = self._generate_outline(topic, plan)
         keywords = self._extract_target_keywords(topic)
         title_variants = self._generate_title_variants(topic, format_type)
         meta_desc = self._generate_meta_description(topic, hook)
@@ -219,7 +269,7 @@ class BriefGenerator:
 
         # Create brief
         brief = ContentBrief(
-            id=str(uuid.uuid4()),
+            id=brief_id or uuid.uuid4().hex,
             title=f"Content Brief: {topic.title}",
             hook=hook,
             outline=outline,
@@ -232,7 +282,7 @@ class BriefGenerator:
             category=topic.category,
             urgency=urgency,
             notes=notes,
-            created_at=datetime.utcnow(),
+            created_at=created_at or datetime.utcnow(),
         )
 
         return brief
@@ -241,6 +291,7 @@ class BriefGenerator:
         self,
         topics: list[Topic],
         limit: int = 5,
+        parallel: bool = False,
     ) -> list[ContentBrief]:
         """
         Generate multiple content briefs from top topics.
@@ -248,24 +299,37 @@ class BriefGenerator:
         Args:
             topics: List of topics (will use highest scored)
             limit: Maximum number of briefs to generate
+            parallel: Generate briefs on a thread pool; worthwhile when the
+                curator does blocking work, pure overhead for CPU-only curators
 
         Returns:
             List of content briefs
         """
-        # Sort by virality score
-        sorted_topics = sorted(topics, key=lambda x: x.virality_score, reverse=True)
-
-        briefs = []
-        for topic in sorted_topics[:limit]:
-            brief = self.generate_brief(topic)
-            briefs.append(brief)
-
-        return briefs
+        # Partial selection beats a full sort when only the top few are needed
+        top_topics = heapq.nlargest(limit, topics, key=lambda x: x.virality_score)
+
+        # One urandom read and one clock read cover the whole batch
+        raw_ids = os.urandom(16 * len(top_topics))
+        ids = [raw_ids[i * 16:(i + 1) * 16].hex() for i in range(len(top_topics))]
+        now = datetime.utcnow()
+
+        if parallel and len(top_topics) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(top_topics))) as executor:
+                return list(executor.map(
+                    lambda pair: self.generate_brief(pair[0], brief_id=pair[1], created_at=now),
+                    zip(top_topics, ids),
+                ))
+
+        return [
+            self.generate_brief(topic, brief_id=brief_id, created_at=now)
+            for topic, brief_id in zip(top_topics, ids)
+        ]
 
     def generate_content_calendar(
         self,
         topics: list[Topic],
         days: int = 7,
+        briefs: Optional[list[ContentBrief]] = None,
     ) -> list[dict]:
         """
         Generate a content calendar from topics.
@@ -273,26 +337,37 @@ class BriefGenerator:
         Args:
             topics: List of topics
             days: Number of days to plan
+            briefs: Already-generated briefs to reuse (e.g. from
+                generate_briefs_from_topics) instead of regenerating
 
         Returns:
             List of calendar entries with dates and briefs
         """
-        from datetime import timedelta
-
         calendar = []
-        sorted_topics = sorted(topics, key=lambda x: x.virality_score, reverse=True)
+        top_topics = heapq.nlargest(days, topics, key=lambda x: x.virality_score)
+
+        # Index existing briefs by source topic so matching topics skip
+        # a full regeneration
+        briefs_by_topic = {}
+        if briefs:
+            for existing in briefs:
+                if existing.source_topics:
+                    source = existing.source_topics[0]
+                    briefs_by_topic[source.id or source.title] = existing
 
-        today = datetime.utcnow().date()
+        now = datetime.utcnow()
+        base_ordinal = now.date().toordinal()
 
-        for i in range(min(days, len(sorted_topics))):
-            topic = sorted_topics[i]
-            brief = self.generate_brief(topic)
+        for i, topic in enumerate(top_topics):
+            brief = briefs_by_topic.get(topic.id or topic.title)
+            if brief is None:
+                brief = self.generate_brief(topic, created_at=now)
 
-            publish_date = today + timedelta(days=i)
+            publish_date = date.fromordinal(base_ordinal + i)
 
             calendar.append({
                 "date": publish_date.isoformat(),
-                "day_of_week": publish_date.strftime("%A"),
+                "day_of_week": _WEEKDAYS[publish_date.weekday()],
                 "topic": topic.title,
                 "format": brief.suggested_format,
                 "urgency": brief.urgency,
@@ -304,46 +379,42 @@ class BriefGenerator:
 
     def format_brief_as_markdown(self, brief: ContentBrief) -> str:
         """Format a content brief as markdown"""
-        md = []
-
-        md.append(f"# {brief.title}")
-        md.append("")
-        md.append(f"**Format:** {brief.suggested_format}")
-        md.append(f"**Word Count:** ~{brief.estimated_word_count} words")
-        md.append(f"**Urgency:** {brief.urgency}")
-        md.append(f"**Category:** {brief.category.value}")
-        md.append("")
-
-        md.append("## Hook")
-        md.append(brief.hook)
-        md.append("")
-
-        md.append("## Title Options")
-        for variant in brief.suggested_title_variants:
-            md.append(f"- {variant}")
-        md.append("")
-
-        md.append("## Target Keywords")
-        md.append(", ".join(brief.target_keywords))
-        md.append("")
-
-        md.append("## Meta Description")
-        md.append(brief.meta_description or "")
-        md.append("")
-
-        md.append("## Outline")
-        for section in brief.outline:
-            md.append(section)
-        md.append("")
+        # Join only the variable-length sections; the fixed skeleton is a
+        # single f-string instead of ~25 list appends
+        variants_md = "\n".join(f"- {v}" for v in brief.suggested_title_variants)
+        outline_md = "\n".join(brief.outline)
+
+        md = f"""# {brief.title}
+
+**Format:** {brief.suggested_format}
+**Word Count:** ~{brief.estimated_word_count} words
+**Urgency:** {brief.urgency}
+**Category:** {brief.category.value}
+
+## Hook
+{brief.hook}
+
+## Title Options
+{variants_md}
+
+## Target Keywords
+{", ".join(brief.target_keywords)}
+
+## Meta Description
+{brief.meta_description or ""}
+
+## Outline
+{outline_md}
+"""
 
         if brief.notes:
-            md.append("## Notes")
-            md.append(brief.notes)
-            md.append("")
+            md += f"\n## Notes\n{brief.notes}\n"
 
         if brief.source_topics:
-            md.append("## Source Topics")
-            for topic in brief.source_topics:
-                md.append(f"- [{topic.title}]({topic.url}) (Score: {topic.virality_score})")
+            sources_md = "\n".join(
+                f"- [{t.title}]({t.url}) (Score: {t.virality_score})"
+                for t in brief.source_topics
+            )
+            md += f"\n## Source Topics\n{sources_md}"
 
-        return "\n".join(md)
+        return md
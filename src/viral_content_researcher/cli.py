@@ -3,90 +3,235 @@ CLI interface for the Viral Content Researcher
 """
 
 import asyncio
+import time
 import click
-from datetime import datetime
+from heapq import nlargest
+from operator import itemgetter
 from typing import Optional
 
+try:
+    # Optional: libuv-based event loop, 2-4x faster on socket-heavy workloads
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 from rich.console import Console
 from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
-from rich.tree import Tree
+from rich.live import Live
 from rich import box
 
 from viral_content_researcher.models import TrendSource, ContentCategory
-from viral_content_researcher.researcher import ViralContentResearcher
-from viral_content_researcher.curator import ContentCurator
-from viral_content_researcher.storage import Storage
-from viral_content_researcher.brief_generator import BriefGenerator
+from viral_content_researcher.brief_generator import BriefFormat
+
+# Panel/Markdown/Tree, the researcher, storage and brief generator are imported
+# inside the commands that need them, keeping `--help` and simple listings fast
+
+
+console = Console(highlight=False)
+
+
+class EnumChoice(click.ParamType):
+    """Click param type that converts a choice string straight to its enum member"""
+
+    name = "choice"
+
+    def __init__(self, enum_cls):
+        self._map = {e.value: e for e in enum_cls}
+
+    def convert(self, value, param, ctx):
+        try:
+            return self._map[value]
+        except KeyError:
+            self.fail(
+                f"'{value}' is not one of {', '.join(self._map)}.",
+                param,
+                ctx,
+            )
+
+    def get_metavar(self, param, ctx=None):
+        return "[" + "|".join(self._map) + "]"
+
+
+# Lazily-built BriefGenerator shared across commands so repeated invocations
+# in one session amortize template-compilation cost
+_brief_generator = None
+
+
+def _get_brief_generator():
+    global _brief_generator
+    if _brief_generator is None:
+        from viral_content_researcher.brief_generator import BriefGenerator
+
+        _brief_generator = BriefGenerator()
+    return _brief_generator
+
+
+# Shared Storage connection opened on first use, so chained commands don't
+# re-pay connection setup; closed once at the end of the command chain
+_storage = None
+
+
+async def _get_storage():
+    global _storage
+    if _storage is None:
+        from viral_content_researcher.storage import Storage
+
+        storage = Storage()
+        await storage.connect()
+        _storage = storage
+    return _storage
+
+
+# Recent-topics cache for the `brief` command: repeated lookups within a short
+# window (e.g. generating briefs for several indexes) skip the DB round trip
+_TOPICS_CACHE_TTL = 30.0
+_topics_cache: Optional[tuple[float, list]] = None
+
+
+async def _get_recent_topics(storage):
+    global _topics_cache
+    now = time.monotonic()
+    if _topics_cache is not None and now - _topics_cache[0] < _TOPICS_CACHE_TTL:
+        return _topics_cache[1]
+
+    topics = await storage.get_topics(limit=25, min_score=0)
+    _topics_cache = (now, topics)
+    return topics
+
+
+def _invalidate_topics_cache() -> None:
+    global _topics_cache
+    _topics_cache = None
+
+
+# Score colors indexed by virality-score bucket (score // 20)
+_SCORE_COLORS = ("red", "orange1", "yellow", "green", "bright_green")
+
+# Urgency colors hoisted to module scope so the dict isn't rebuilt per call
+_URGENCY_COLORS = {
+    "trending_now": "bright_red",
+    "high": "red",
+    "medium": "yellow",
+    "low": "dim",
+}
+
+
+# Column specs per table type, declared once so command bodies just clone them
+_TRENDING_COLUMNS = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "bold", "max_width": 50, "overflow": "ellipsis", "no_wrap": True}),
+    ("Score", {"justify": "center", "width": 8}),
+    ("Source", {"justify": "center", "width": 12}),
+    ("Category", {"justify": "center", "width": 15}),
+    ("Engagement", {"justify": "right", "width": 12}),
+)
+
+_SEARCH_COLUMNS = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "bold", "max_width": 55, "overflow": "ellipsis", "no_wrap": True}),
+    ("Score", {"justify": "center", "width": 8}),
+    ("Source", {"justify": "center", "width": 12}),
+)
 
+_SAVED_COLUMNS = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "bold", "max_width": 50, "overflow": "ellipsis", "no_wrap": True}),
+    ("Score", {"justify": "center", "width": 8}),
+    ("Category", {"justify": "center", "width": 15}),
+)
 
-console = Console()
+_CALENDAR_COLUMNS = (
+    ("Date", {"style": "cyan", "width": 12}),
+    ("Day", {"width": 10}),
+    ("Topic", {"style": "bold", "max_width": 40, "overflow": "ellipsis", "no_wrap": True}),
+    ("Format", {"justify": "center", "width": 12}),
+    ("Urgency", {"justify": "center", "width": 12}),
+    ("Est. Time", {"justify": "right", "width": 10}),
+)
 
+_SOURCES_COLUMNS = (
+    ("Source", {"style": "cyan"}),
+    ("Description", {}),
+    ("Status", {"justify": "center"}),
+)
 
-def run_async(coro):
-    """Run an async function in the event loop"""
-    return asyncio.get_event_loop().run_until_complete(coro)
 
+def _build_table(title, columns, **table_kwargs):
+    """Build a Rich table from a precompiled column spec"""
+    table = Table(title=title, box=box.ROUNDED, **table_kwargs)
+    for name, kwargs in columns:
+        table.add_column(name, **kwargs)
+    return table
 
-def get_score_color(score: float) -> str:
-    """Get color based on virality score"""
-    if score >= 80:
-        return "bright_green"
-    elif score >= 60:
-        return "green"
-    elif score >= 40:
-        return "yellow"
-    elif score >= 20:
-        return "orange1"
-    else:
-        return "red"
 
+# Markup open/close tags pre-rendered per color so row loops only concatenate
+_SCORE_WRAPS = tuple((f"[{c}]", f"[/{c}]") for c in _SCORE_COLORS)
+_URGENCY_WRAPS = {u: (f"[{c}]", f"[/{c}]") for u, c in _URGENCY_COLORS.items()}
+_DEFAULT_WRAP = ("[white]", "[/white]")
 
-def get_urgency_color(urgency: str) -> str:
-    """Get color based on urgency level"""
-    colors = {
-        "trending_now": "bright_red",
-        "high": "red",
-        "medium": "yellow",
-        "low": "dim",
-    }
-    return colors.get(urgency, "white")
 
+def _score_cell(score: float) -> str:
+    """Render a virality score with its bucket color markup"""
+    open_tag, close_tag = _SCORE_WRAPS[min(int(score) // 20, 4)]
+    return f"{open_tag}{score:.0f}{close_tag}"
 
-@click.group()
+
+def _urgency_cell(urgency: str) -> str:
+    """Render an urgency level with its color markup"""
+    open_tag, close_tag = _URGENCY_WRAPS.get(urgency, _DEFAULT_WRAP)
+    return open_tag + urgency + close_tag
+
+
+@click.group(chain=True)
 @click.version_option(version="1.0.0")
 def main():
     """
     Viral Content Researcher - Find trending marketing topics
 
     Research and curate viral content opportunities for your marketing strategy.
+
+    Commands can be chained (e.g. `vcr trending --save stats`) and share one
+    event loop and storage connection across the whole chain.
     """
     pass
 
 
+@main.result_callback()
+def _run_commands(results, **kwargs):
+    """Run the coroutines returned by chained commands on a single event loop"""
+    coros = [r for r in results if asyncio.iscoroutine(r)]
+    if not coros:
+        return
+
+    global _storage
+    loop = asyncio.new_event_loop()
+    try:
+        for coro in coros:
+            loop.run_until_complete(coro)
+    finally:
+        if _storage is not None:
+            loop.run_until_complete(_storage.close())
+            _storage = None
+        loop.close()
+
+
 @main.command()
 @click.option("--limit", "-l", default=15, help="Number of topics to show")
-@click.option("--category", "-c", type=click.Choice([c.value for c in ContentCategory]), help="Filter by category")
-@click.option("--source", "-s", type=click.Choice([s.value for s in TrendSource]), help="Filter by source")
+@click.option("--category", "-c", type=EnumChoice(ContentCategory), help="Filter by category")
+@click.option("--source", "-s", type=EnumChoice(TrendSource), help="Filter by source")
 @click.option("--min-score", default=30.0, help="Minimum virality score")
 @click.option("--save", is_flag=True, help="Save results to database")
-def trending(limit: int, category: Optional[str], source: Optional[str], min_score: float, save: bool):
+def trending(limit: int, category: Optional[ContentCategory], source: Optional[TrendSource], min_score: float, save: bool):
     """Discover trending marketing topics from all sources"""
 
     async def _run():
-        sources = [TrendSource(source)] if source else None
-        categories = [ContentCategory(category)] if category else None
+        from viral_content_researcher.researcher import ViralContentResearcher
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Researching trending topics...", total=None)
+        sources = [source] if source else None
+        categories = [category] if category else None
 
+        with console.status("Researching trending topics..."):
             async with ViralContentResearcher() as researcher:
                 topics = await researcher.research_trending(
                     limit=limit,
@@ -99,63 +244,56 @@ def trending(limit: int, category: Optional[str], source: Optional[str], min_sco
             console.print("[yellow]No trending topics found matching your criteria.[/yellow]")
             return
 
-        # Create table
-        table = Table(
-            title="Trending Marketing Topics",
-            box=box.ROUNDED,
+        # Kick off the save before rendering so the DB write overlaps the
+        # table layout work
+        save_task = None
+        if save:
+            storage = await _get_storage()
+            save_task = asyncio.create_task(storage.save_topics(topics))
+
+        table = _build_table(
+            "Trending Marketing Topics",
+            _TRENDING_COLUMNS,
             show_lines=True,
             title_style="bold magenta",
         )
 
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Title", style="bold", max_width=50)
-        table.add_column("Score", justify="center", width=8)
-        table.add_column("Source", justify="center", width=12)
-        table.add_column("Category", justify="center", width=15)
-        table.add_column("Engagement", justify="right", width=12)
-
-        for idx, topic in enumerate(topics, 1):
-            score_color = get_score_color(topic.virality_score)
-            engagement = f"{topic.score} / {topic.comments}c"
-
-            table.add_row(
-                str(idx),
-                topic.title[:50] + "..." if len(topic.title) > 50 else topic.title,
-                f"[{score_color}]{topic.virality_score:.0f}[/{score_color}]",
-                topic.source.value,
-                topic.category.value,
-                engagement,
-            )
+        # Stream rows through Live so the first results render immediately
+        with Live(table, console=console, refresh_per_second=8):
+            for idx, topic in enumerate(topics, 1):
+                engagement = f"{topic.score} / {topic.comments}c"
+
+                table.add_row(
+                    str(idx),
+                    topic.title,
+                    _score_cell(topic.virality_score),
+                    topic.source.value,
+                    topic.category.value,
+                    engagement,
+                )
 
-        console.print(table)
         console.print(f"\n[dim]Found {len(topics)} trending topics[/dim]")
 
-        if save:
-            async with Storage() as storage:
-                saved = await storage.save_topics(topics)
-                console.print(f"[green]Saved {saved} topics to database[/green]")
+        if save_task is not None:
+            saved = await save_task
+            console.print(f"[green]Saved {saved} topics to database[/green]")
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
 @click.argument("query")
 @click.option("--limit", "-l", default=15, help="Number of results")
-@click.option("--source", "-s", type=click.Choice([s.value for s in TrendSource]), help="Search specific source")
-def search(query: str, limit: int, source: Optional[str]):
+@click.option("--source", "-s", type=EnumChoice(TrendSource), help="Search specific source")
+def search(query: str, limit: int, source: Optional[TrendSource]):
     """Search for specific marketing topics"""
 
     async def _run():
-        sources = [TrendSource(source)] if source else None
+        from viral_content_researcher.researcher import ViralContentResearcher
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task(f"Searching for '{query}'...", total=None)
+        sources = [source] if source else None
 
+        with console.status(f"Searching for '{query}'..."):
             async with ViralContentResearcher() as researcher:
                 topics = await researcher.search(query, limit=limit, sources=sources)
 
@@ -163,57 +301,46 @@ def search(query: str, limit: int, source: Optional[str]):
             console.print(f"[yellow]No results found for '{query}'[/yellow]")
             return
 
-        table = Table(
-            title=f"Search Results: '{query}'",
-            box=box.ROUNDED,
-            show_lines=True,
-        )
-
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Title", style="bold", max_width=55)
-        table.add_column("Score", justify="center", width=8)
-        table.add_column("Source", justify="center", width=12)
-
-        for idx, topic in enumerate(topics, 1):
-            score_color = get_score_color(topic.virality_score)
-            table.add_row(
-                str(idx),
-                topic.title[:55] + "..." if len(topic.title) > 55 else topic.title,
-                f"[{score_color}]{topic.virality_score:.0f}[/{score_color}]",
-                topic.source.value,
-            )
+        table = _build_table(f"Search Results: '{query}'", _SEARCH_COLUMNS, show_lines=True)
 
-        console.print(table)
+        with Live(table, console=console, refresh_per_second=8):
+            for idx, topic in enumerate(topics, 1):
+                table.add_row(
+                    str(idx),
+                    topic.title,
+                    _score_cell(topic.virality_score),
+                    topic.source.value,
+                )
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
 @click.option("--limit", "-l", default=5, help="Number of briefs to generate")
-@click.option("--category", "-c", type=click.Choice([c.value for c in ContentCategory]), help="Filter by category")
+@click.option("--category", "-c", type=EnumChoice(ContentCategory), help="Filter by category")
 @click.option("--save", is_flag=True, help="Save briefs to database")
-def briefs(limit: int, category: Optional[str], save: bool):
+def briefs(limit: int, category: Optional[ContentCategory], save: bool):
     """Generate content briefs from trending topics"""
 
     async def _run():
-        categories = [ContentCategory(category)] if category else None
+        from rich.panel import Panel
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Generating content briefs...", total=None)
+        from viral_content_researcher.researcher import ViralContentResearcher
 
+        categories = [category] if category else None
+
+        with console.status("Generating content briefs..."):
             async with ViralContentResearcher() as researcher:
-                topics = await researcher.research_trending(
-                    limit=limit * 2,
-                    categories=categories,
-                    min_score=40.0,
+                # Overlap generator construction with the network-bound research
+                topics, generator = await asyncio.gather(
+                    researcher.research_trending(
+                        limit=limit * 2,
+                        categories=categories,
+                        min_score=40.0,
+                    ),
+                    asyncio.to_thread(_get_brief_generator),
                 )
 
-            generator = BriefGenerator()
             content_briefs = generator.generate_briefs_from_topics(topics, limit=limit)
 
         if not content_briefs:
@@ -221,17 +348,18 @@ def briefs(limit: int, category: Optional[str], save: bool):
             return
 
         for idx, brief in enumerate(content_briefs, 1):
-            urgency_color = get_urgency_color(brief.urgency)
+            keywords = ", ".join(brief.target_keywords[:5])
+            title_options = "\n".join("  - " + t for t in brief.suggested_title_variants[:3])
 
             panel = Panel(
                 f"""[bold]Hook:[/bold] {brief.hook}
 
-[bold]Format:[/bold] {brief.suggested_format}  |  [bold]Words:[/bold] ~{brief.estimated_word_count}  |  [bold]Urgency:[/bold] [{urgency_color}]{brief.urgency}[/{urgency_color}]
+[bold]Format:[/bold] {brief.suggested_format}  |  [bold]Words:[/bold] ~{brief.estimated_word_count}  |  [bold]Urgency:[/bold] {_urgency_cell(brief.urgency)}
 
-[bold]Keywords:[/bold] {', '.join(brief.target_keywords[:5])}
+[bold]Keywords:[/bold] {keywords}
 
 [bold]Title Options:[/bold]
-{chr(10).join('  - ' + t for t in brief.suggested_title_variants[:3])}
+{title_options}
 """,
                 title=f"[bold cyan]Brief #{idx}: {brief.title}[/bold cyan]",
                 border_style="cyan",
@@ -239,73 +367,61 @@ def briefs(limit: int, category: Optional[str], save: bool):
             console.print(panel)
 
         if save:
-            async with Storage() as storage:
-                for brief in content_briefs:
-                    await storage.save_brief(brief)
-                console.print(f"[green]Saved {len(content_briefs)} briefs to database[/green]")
+            storage = await _get_storage()
+            saved = await storage.save_briefs(content_briefs)
+            console.print(f"[green]Saved {saved} briefs to database[/green]")
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
 @click.option("--days", "-d", default=7, help="Number of days to plan")
-@click.option("--category", "-c", type=click.Choice([c.value for c in ContentCategory]), help="Filter by category")
-def calendar(days: int, category: Optional[str]):
+@click.option("--category", "-c", type=EnumChoice(ContentCategory), help="Filter by category")
+def calendar(days: int, category: Optional[ContentCategory]):
     """Generate a content calendar from trending topics"""
 
     async def _run():
-        categories = [ContentCategory(category)] if category else None
+        from viral_content_researcher.researcher import ViralContentResearcher
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Building content calendar...", total=None)
+        categories = [category] if category else None
 
+        with console.status("Building content calendar..."):
             async with ViralContentResearcher() as researcher:
-                topics = await researcher.research_trending(
-                    limit=days * 2,
-                    categories=categories,
-                    min_score=35.0,
+                # Overlap generator construction with the network-bound research
+                topics, generator = await asyncio.gather(
+                    researcher.research_trending(
+                        limit=days * 2,
+                        categories=categories,
+                        min_score=35.0,
+                    ),
+                    asyncio.to_thread(_get_brief_generator),
                 )
 
-            generator = BriefGenerator()
             cal = generator.generate_content_calendar(topics, days=days)
 
         if not cal:
             console.print("[yellow]Could not generate calendar. Not enough topics found.[/yellow]")
             return
 
-        table = Table(
-            title="Content Calendar",
-            box=box.ROUNDED,
+        table = _build_table(
+            "Content Calendar",
+            _CALENDAR_COLUMNS,
             show_lines=True,
             title_style="bold magenta",
         )
 
-        table.add_column("Date", style="cyan", width=12)
-        table.add_column("Day", width=10)
-        table.add_column("Topic", style="bold", max_width=40)
-        table.add_column("Format", justify="center", width=12)
-        table.add_column("Urgency", justify="center", width=12)
-        table.add_column("Est. Time", justify="right", width=10)
-
-        for entry in cal:
-            urgency_color = get_urgency_color(entry["urgency"])
-            table.add_row(
-                entry["date"],
-                entry["day_of_week"][:3],
-                entry["topic"][:40] + "..." if len(entry["topic"]) > 40 else entry["topic"],
-                entry["format"],
-                f"[{urgency_color}]{entry['urgency']}[/{urgency_color}]",
-                entry["estimated_time"],
-            )
-
-        console.print(table)
+        with Live(table, console=console, refresh_per_second=8):
+            for entry in cal:
+                table.add_row(
+                    entry["date"],
+                    entry["day_of_week"][:3],
+                    entry["topic"],
+                    entry["format"],
+                    _urgency_cell(entry["urgency"]),
+                    entry["estimated_time"],
+                )
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
@@ -313,14 +429,11 @@ def insights():
     """Get marketing insights and recommendations"""
 
     async def _run():
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Analyzing marketing trends...", total=None)
+        from rich.tree import Tree
+
+        from viral_content_researcher.researcher import ViralContentResearcher
 
+        with console.status("Analyzing marketing trends..."):
             async with ViralContentResearcher() as researcher:
                 data = await researcher.get_marketing_insights(limit=10)
 
@@ -332,63 +445,53 @@ def insights():
         # Category Breakdown
         console.print("\n[bold magenta]Topics by Category[/bold magenta]")
         tree = Tree("[bold]Categories[/bold]")
-        for cat, count in sorted(data["category_breakdown"].items(), key=lambda x: x[1], reverse=True):
+        for cat, count in sorted(data["category_breakdown"].items(), key=itemgetter(1), reverse=True):
             tree.add(f"{cat}: {count} topics")
         console.print(tree)
 
         # Top Recommendations
         console.print("\n[bold magenta]Content Recommendations[/bold magenta]")
         for idx, rec in enumerate(data["recommendations"], 1):
-            urgency_color = get_urgency_color(rec["urgency"])
             console.print(f"\n[bold]{idx}. {rec['topic']}[/bold]")
-            console.print(f"   Format: {rec['format']} | Urgency: [{urgency_color}]{rec['urgency']}[/{urgency_color}]")
+            console.print(f"   Format: {rec['format']} | Urgency: {_urgency_cell(rec['urgency'])}")
             console.print("   Angles:")
             for angle in rec["angles"]:
                 console.print(f"     - {angle}")
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
 @click.option("--limit", "-l", default=25, help="Number of saved topics to show")
-@click.option("--category", "-c", type=click.Choice([c.value for c in ContentCategory]), help="Filter by category")
-def saved(limit: int, category: Optional[str]):
+@click.option("--category", "-c", type=EnumChoice(ContentCategory), help="Filter by category")
+def saved(limit: int, category: Optional[ContentCategory]):
     """View saved topics from the database"""
 
     async def _run():
-        cat = ContentCategory(category) if category else None
-
-        async with Storage() as storage:
-            topics = await storage.get_topics(
-                limit=limit,
-                saved_only=True,
-                category=cat,
-            )
+        storage = await _get_storage()
+        topics = await storage.get_topics(
+            limit=limit,
+            saved_only=True,
+            category=category,
+        )
 
         if not topics:
             console.print("[yellow]No saved topics found.[/yellow]")
             console.print("[dim]Use --save flag with 'trending' or 'search' to save topics.[/dim]")
             return
 
-        table = Table(title="Saved Topics", box=box.ROUNDED)
-
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Title", style="bold", max_width=50)
-        table.add_column("Score", justify="center", width=8)
-        table.add_column("Category", justify="center", width=15)
+        table = _build_table("Saved Topics", _SAVED_COLUMNS)
 
-        for idx, topic in enumerate(topics, 1):
-            score_color = get_score_color(topic.virality_score)
-            table.add_row(
-                str(idx),
-                topic.title[:50],
-                f"[{score_color}]{topic.virality_score:.0f}[/{score_color}]",
-                topic.category.value,
-            )
-
-        console.print(table)
+        with Live(table, console=console, refresh_per_second=8):
+            for idx, topic in enumerate(topics, 1):
+                table.add_row(
+                    str(idx),
+                    topic.title,
+                    _score_cell(topic.virality_score),
+                    topic.category.value,
+                )
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
@@ -396,8 +499,8 @@ def stats():
     """Show database statistics"""
 
     async def _run():
-        async with Storage() as storage:
-            data = await storage.get_stats()
+        storage = await _get_storage()
+        data = await storage.get_stats()
 
         console.print("\n[bold magenta]Database Statistics[/bold magenta]\n")
 
@@ -412,10 +515,10 @@ def stats():
 
         if data.get("topics_by_category"):
             console.print("\n[bold]Topics by Category:[/bold]")
-            for cat, count in sorted(data["topics_by_category"].items(), key=lambda x: x[1], reverse=True)[:5]:
+            for cat, count in nlargest(5, data["topics_by_category"].items(), key=itemgetter(1)):
                 console.print(f"  {cat}: {count}")
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
@@ -425,38 +528,41 @@ def cleanup(days: int):
     """Clean up old topics from database"""
 
     async def _run():
-        async with Storage() as storage:
-            deleted = await storage.cleanup_old_topics(days=days)
+        storage = await _get_storage()
+        deleted = await storage.cleanup_old_topics(days=days)
+        _invalidate_topics_cache()
 
         console.print(f"[green]Cleaned up {deleted} old topics.[/green]")
 
-    run_async(_run())
+    return _run()
 
 
 @main.command()
 @click.argument("topic_index", type=int)
-@click.option("--format", "-f", "format_type", type=click.Choice(["blog_post", "guide", "listicle", "tutorial", "comparison", "case_study"]), help="Content format")
-def brief(topic_index: int, format_type: Optional[str]):
+@click.option("--format", "-f", "format_type", type=EnumChoice(BriefFormat), help="Content format")
+def brief(topic_index: int, format_type: Optional[BriefFormat]):
     """Generate a detailed brief for a specific topic (by index from last search)"""
 
     async def _run():
         # Get recent topics
-        async with Storage() as storage:
-            topics = await storage.get_topics(limit=25, min_score=0)
+        storage = await _get_storage()
+        topics = await _get_recent_topics(storage)
 
         if topic_index < 1 or topic_index > len(topics):
             console.print(f"[red]Invalid topic index. Choose 1-{len(topics)}[/red]")
             return
 
+        from rich.markdown import Markdown
+
         topic = topics[topic_index - 1]
-        generator = BriefGenerator()
+        generator = _get_brief_generator()
         content_brief = generator.generate_brief(topic, format_type=format_type)
 
         # Display as markdown
         md = generator.format_brief_as_markdown(content_brief)
         console.print(Markdown(md))
 
-    run_async(_run())
+    return _run()
 
 
 @main.command("sources")
@@ -474,10 +580,7 @@ def list_sources():
         ("linkedin", "LinkedIn trending content (coming soon)", False),
     ]
 
-    table = Table(box=box.ROUNDED)
-    table.add_column("Source", style="cyan")
-    table.add_column("Description")
-    table.add_column("Status", justify="center")
+    table = _build_table(None, _SOURCES_COLUMNS)
 
     for source, desc, available in sources_info:
         status = "[green]Available[/green]" if available else "[dim]Unavailable[/dim]"
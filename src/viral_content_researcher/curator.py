@@ -2,13 +2,38 @@
 Content curation and scoring engine for viral marketing topics
 """
 
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
+import heapq
+import operator
 import re
 
+import numpy as np
+
 from viral_content_researcher.models import Topic, ContentCategory, ContentBrief
 
 
+@lru_cache(maxsize=4096)
+def _engagement_score(score: int, comments: int, shares: int) -> float:
+    """Engagement sub-score memoized on its raw metrics.
+
+    The same topics are re-scored across research_trending calls (e.g.
+    research_category and get_marketing_insights both fetch limit=100), so
+    repeated metric triples hit the cache.
+    """
+    total = 0
+    if score > 0:
+        total += min(score / 50, 40)
+    if comments > 0:
+        total += min(comments / 25, 30)
+    if shares > 0:
+        total += min(shares / 10, 30)
+    return min(total, 100)
+
+
 class ContentCurator:
     """
     Curates and scores topics for viral potential and marketing relevance.
@@ -38,6 +63,15 @@ class ContentCurator:
         "announcement", "release", "introducing", "first",
     ]
 
+    # Keyword matchers split by arity: single-word keywords check against the
+    # topic's cached token set with one C-level intersection, so only the few
+    # multi-word phrases still need a substring scan. Matching whole tokens
+    # also stops "ai" from firing inside "email".
+    _HV_SINGLE = frozenset(kw for kw in HIGH_VALUE_KEYWORDS if " " not in kw)
+    _HV_MULTI = tuple(kw for kw in HIGH_VALUE_KEYWORDS if " " in kw)
+    _TREND_SINGLE = frozenset(ind for ind in TRENDING_INDICATORS if " " not in ind)
+    _TREND_MULTI = tuple(ind for ind in TRENDING_INDICATORS if " " in ind)
+
     # Content format preferences (for brief generation)
     FORMAT_KEYWORDS = {
         "how to": "tutorial",
@@ -54,6 +88,30 @@ class ContentCurator:
         "strategy": "strategy_guide",
     }
 
+    # Recency and velocity ladders as sorted thresholds plus score tables, so
+    # one bisect (np.searchsorted in the batch path) replaces up to six
+    # branch comparisons per topic
+    _RECENCY_THRESH = (2, 6, 12, 24, 48, 72)
+    _RECENCY_SCORES = (100, 90, 80, 70, 50, 30, 10)
+    _VELOCITY_THRESH = (5, 10, 25, 50)
+    _VELOCITY_SCORES = (20, 40, 60, 80, 100)
+
+    # Format-keyword matcher compiled once; each keyword gets its own group so
+    # a match maps straight back to a format. Ties between keywords are
+    # resolved by FORMAT_KEYWORDS declaration order, matching the old dict walk.
+    _FMT_RE = re.compile("|".join(f"({re.escape(kw)})" for kw in FORMAT_KEYWORDS))
+    _FMT_TABLE = tuple(FORMAT_KEYWORDS.values())
+
+    # Default format per category, hoisted from identify_content_format
+    _CATEGORY_FORMATS = {
+        ContentCategory.SEO: "guide",
+        ContentCategory.SOCIAL_MEDIA: "listicle",
+        ContentCategory.CONTENT_MARKETING: "guide",
+        ContentCategory.ANALYTICS: "tutorial",
+        ContentCategory.AI_MARKETING: "tool_review",
+        ContentCategory.STARTUP: "case_study",
+    }
+
     def __init__(
         self,
         min_score: float = 30.0,
@@ -68,64 +126,69 @@ class ContentCurator:
             ContentCategory.SEO,
         ]
 
+        # Per-topic memo tables keyed by Topic.id; relevance and format are
+        # pure functions of a topic's text, so re-scoring the same topics in
+        # back-to-back research calls skips the regex scans
+        self._relevance_cache: dict[str, float] = {}
+        self._format_cache: dict[str, str] = {}
+
+        # Specialize the weighted-sum combiner once the weights are known:
+        # compiling them in as literals turns five dict lookups per topic
+        # into a flat arithmetic expression
+        w = self.WEIGHTS
+        src = (
+            "def _combine(e, r, l, v, u):\n"
+            f"    return round(e * {w['engagement']!r} + r * {w['recency']!r}"
+            f" + l * {w['relevance']!r} + v * {w['velocity']!r}"
+            f" + u * {w['uniqueness']!r}, 2)\n"
+        )
+        namespace: dict = {}
+        exec(compile(src, "<curator-combine>", "exec"), namespace)
+        self._combine = namespace["_combine"]
+
     def calculate_engagement_score(self, topic: Topic) -> float:
         """Calculate normalized engagement score (0-100)"""
-        # Weighted engagement metrics
-        score = 0
+        return _engagement_score(topic.score, topic.comments, topic.shares)
 
-        # Upvotes/score (different scales for different sources)
-        if topic.score > 0:
-            score += min(topic.score / 50, 40)
+    @staticmethod
+    def _topic_hours_old(topic: Topic, now_ts: float) -> Optional[float]:
+        """Age of a topic in hours against a caller-supplied timestamp.
 
-        # Comments indicate discussion quality
-        if topic.comments > 0:
-            score += min(topic.comments / 25, 30)
-
-        # Shares indicate viral potential
-        if topic.shares > 0:
-            score += min(topic.shares / 10, 30)
-
-        return min(score, 100)
+        published_at is tz-aware by model validation, so no tzinfo handling
+        is needed here.
+        """
+        if not topic.published_at:
+            return None
+        return (now_ts - topic.published_at.timestamp()) / 3600
 
-    def calculate_recency_score(self, topic: Topic) -> float:
+    def calculate_recency_score(self, topic: Topic, hours_old: Optional[float] = None) -> float:
         """Calculate recency score - newer content scores higher"""
-        if not topic.published_at:
+        if hours_old is None:
+            hours_old = self._topic_hours_old(topic, datetime.now(timezone.utc).timestamp())
+        if hours_old is None:
             return 30  # Unknown date gets middle score
 
-        now = datetime.now(timezone.utc)
-        published = topic.published_at.replace(tzinfo=timezone.utc) if topic.published_at.tzinfo is None else topic.published_at
-
-        hours_old = (now - published).total_seconds() / 3600
-
-        if hours_old < 2:
-            return 100
-        elif hours_old < 6:
-            return 90
-        elif hours_old < 12:
-            return 80
-        elif hours_old < 24:
-            return 70
-        elif hours_old < 48:
-            return 50
-        elif hours_old < 72:
-            return 30
-        else:
-            return 10
+        return self._RECENCY_SCORES[bisect_right(self._RECENCY_THRESH, hours_old)]
 
     def calculate_relevance_score(self, topic: Topic) -> float:
         """Calculate marketing relevance score"""
+        cached = self._relevance_cache.get(topic.id) if topic.id else None
+        if cached is not None:
+            return cached
+
         score = 50  # Base score
 
-        title_lower = topic.title.lower()
-        desc_lower = (topic.description or "").lower()
-        text = f"{title_lower} {desc_lower}"
+        text = topic.relevance_text
+        tokens = topic.relevance_tokens
 
-        # Boost for high-value keywords
-        keyword_matches = sum(1 for kw in self.HIGH_VALUE_KEYWORDS if kw in text)
+        # Boost for high-value keywords; each distinct keyword counts once
+        keyword_matches = len(self._HV_SINGLE & tokens)
+        keyword_matches += sum(1 for kw in self._HV_MULTI if kw in text)
         score += min(keyword_matches * 5, 30)
 
         # Boost for trending indicators
-        trending_matches = sum(1 for ind in self.TRENDING_INDICATORS if ind in text)
+        trending_matches = len(self._TREND_SINGLE & tokens)
+        trending_matches += sum(1 for ind in self._TREND_MULTI if ind in text)
         score += min(trending_matches * 5, 15)
 
         # Boost for preferred categories
@@ -136,71 +199,158 @@ class ContentCurator:
         if topic.keywords:
             score += min(len(topic.keywords) * 2, 10)
 
-        return min(score, 100)
+        score = min(score, 100)
+        if topic.id:
+            self._relevance_cache[topic.id] = score
+        return score
 
-    def calculate_velocity_score(self, topic: Topic) -> float:
+    def calculate_velocity_score(self, topic: Topic, hours_old: Optional[float] = None) -> float:
         """Estimate trending velocity - how fast is this topic growing"""
         if topic.trending_velocity > 0:
             return min(topic.trending_velocity, 100)
 
         # Estimate based on engagement relative to age
-        if not topic.published_at:
+        if hours_old is None:
+            hours_old = self._topic_hours_old(topic, datetime.now(timezone.utc).timestamp())
+        if hours_old is None:
             return 40
 
-        now = datetime.now(timezone.utc)
-        published = topic.published_at.replace(tzinfo=timezone.utc) if topic.published_at.tzinfo is None else topic.published_at
-        hours_old = max((now - published).total_seconds() / 3600, 1)
-
         # Engagement per hour
-        engagement_rate = (topic.score + topic.comments * 2) / hours_old
-
-        if engagement_rate > 50:
-            return 100
-        elif engagement_rate > 25:
-            return 80
-        elif engagement_rate > 10:
-            return 60
-        elif engagement_rate > 5:
-            return 40
-        else:
-            return 20
+        engagement_rate = (topic.score + topic.comments * 2) / max(hours_old, 1)
+
+        return self._VELOCITY_SCORES[bisect_left(self._VELOCITY_THRESH, engagement_rate)]
 
     def calculate_uniqueness_score(self, topic: Topic, existing_topics: list[Topic] = None) -> float:
         """Calculate how unique this topic is compared to others"""
         if not existing_topics:
             return 70  # Default when no comparison available
 
-        title_words = set(topic.title.lower().split())
+        title_words = topic.title_tokens
 
         # Check overlap with existing topics
         max_overlap = 0
         for existing in existing_topics:
             if existing.id == topic.id:
                 continue
-            existing_words = set(existing.title.lower().split())
-            overlap = len(title_words & existing_words) / max(len(title_words), 1)
+            overlap = len(title_words & existing.title_tokens) / max(len(title_words), 1)
             max_overlap = max(max_overlap, overlap)
 
         # High overlap = low uniqueness
+        return self._uniqueness_from_overlap(max_overlap)
+
+    @staticmethod
+    def _uniqueness_from_overlap(max_overlap: float) -> float:
+        """Map the highest title-word overlap fraction to a uniqueness score"""
         return max(100 - (max_overlap * 100), 10)
 
-    def score_topic(self, topic: Topic, existing_topics: list[Topic] = None) -> float:
+    def _max_overlap_fractions(self, topics: list[Topic]) -> list[float]:
+        """Compute each topic's highest title-word overlap with any other topic.
+
+        Builds a token -> topic-index inverted index once, so pairwise overlap
+        comes from postings-list scatter-adds instead of O(N^2) set
+        intersections. Topics sharing an id are treated as the same topic,
+        matching calculate_uniqueness_score's skip rule.
+        """
+        n = len(topics)
+        title_tokens = [t.title_tokens for t in topics]
+
+        postings: dict[str, list[int]] = {}
+        indices_by_id: dict[Optional[str], list[int]] = {}
+        for i, tokens in enumerate(title_tokens):
+            indices_by_id.setdefault(topics[i].id, []).append(i)
+            for token in tokens:
+                postings.setdefault(token, []).append(i)
+
+        # Freeze postings lists into int arrays once, so the per-topic
+        # scatter-add below is a concatenate + bincount in C instead of a
+        # nested Python loop over postings entries
+        postings_np = {token: np.asarray(idx, dtype=np.intp) for token, idx in postings.items()}
+
+        fractions = []
+        for i, tokens in enumerate(title_tokens):
+            if tokens:
+                hits = np.concatenate([postings_np[token] for token in tokens])
+                overlap_counts = np.bincount(hits, minlength=n)
+            else:
+                overlap_counts = np.zeros(n, dtype=np.intp)
+            overlap_counts[indices_by_id[topics[i].id]] = 0
+
+            max_overlap = overlap_counts.max(initial=0) / max(len(tokens), 1)
+            fractions.append(float(max_overlap))
+
+        return fractions
+
+    def score_topic(
+        self,
+        topic: Topic,
+        existing_topics: list[Topic] = None,
+        uniqueness: Optional[float] = None,
+        hours_old: Optional[float] = None,
+    ) -> float:
         """Calculate comprehensive virality score for a topic"""
-        scores = {
-            "engagement": self.calculate_engagement_score(topic),
-            "recency": self.calculate_recency_score(topic),
-            "relevance": self.calculate_relevance_score(topic),
-            "velocity": self.calculate_velocity_score(topic),
-            "uniqueness": self.calculate_uniqueness_score(topic, existing_topics),
-        }
+        if uniqueness is None:
+            uniqueness = self.calculate_uniqueness_score(topic, existing_topics)
+        if hours_old is None:
+            hours_old = self._topic_hours_old(topic, datetime.now(timezone.utc).timestamp())
+
+        return self._combine(
+            self.calculate_engagement_score(topic),
+            self.calculate_recency_score(topic, hours_old),
+            self.calculate_relevance_score(topic),
+            self.calculate_velocity_score(topic, hours_old),
+            uniqueness,
+        )
 
-        # Weighted average
-        final_score = sum(
-            scores[key] * self.WEIGHTS[key]
-            for key in scores
+    def _partial_scores_batch(
+        self,
+        topics: list[Topic],
+        hours_old: list[Optional[float]],
+    ) -> np.ndarray:
+        """Weighted sum of the four cheap sub-scores, excluding uniqueness.
+
+        Engagement, recency and velocity operate on structure-of-arrays
+        buffers; relevance stays per-topic because it runs the compiled
+        keyword regexes over each topic's text. Uniqueness is left out so
+        curate_topics can prune on an upper bound before paying for the
+        overlap pass.
+        """
+        scores_np = np.array([t.score for t in topics], dtype=np.float64)
+        comments_np = np.array([t.comments for t in topics], dtype=np.float64)
+        shares_np = np.array([t.shares for t in topics], dtype=np.float64)
+        velocity_np = np.array([t.trending_velocity for t in topics], dtype=np.float64)
+        hours_np = np.array([np.nan if h is None else h for h in hours_old], dtype=np.float64)
+        unknown_age = np.isnan(hours_np)
+
+        engagement = np.minimum(
+            np.minimum(np.clip(scores_np, 0, None) / 50, 40)
+            + np.minimum(np.clip(comments_np, 0, None) / 25, 30)
+            + np.minimum(np.clip(shares_np, 0, None) / 10, 30),
+            100,
         )
 
-        return round(final_score, 2)
+        recency_table = np.asarray(self._RECENCY_SCORES, dtype=np.float64)
+        recency_idx = np.searchsorted(self._RECENCY_THRESH, hours_np, side="right")
+        recency = np.where(unknown_age, 30, recency_table[recency_idx])
+
+        relevance = np.array([self.calculate_relevance_score(t) for t in topics], dtype=np.float64)
+
+        with np.errstate(invalid="ignore"):
+            engagement_rate = (scores_np + comments_np * 2) / np.maximum(hours_np, 1)
+        velocity_table = np.asarray(self._VELOCITY_SCORES, dtype=np.float64)
+        velocity_idx = np.searchsorted(self._VELOCITY_THRESH, np.nan_to_num(engagement_rate), side="left")
+        velocity = np.where(
+            velocity_np > 0,
+            np.minimum(velocity_np, 100),
+            np.where(unknown_age, 40, velocity_table[velocity_idx]),
+        )
+
+        w = self.WEIGHTS
+        return (
+            engagement * w["engagement"]
+            + recency * w["recency"]
+            + relevance * w["relevance"]
+            + velocity * w["velocity"]
+        )
 
     def curate_topics(
         self,
@@ -227,70 +377,103 @@ class ContentCurator:
         if categories:
             topics = [t for t in topics if t.category in categories]
 
-        # Filter by age
-        now = datetime.now(timezone.utc)
-        topics = [
-            t for t in topics
-            if not t.published_at or
-            (now - t.published_at.replace(tzinfo=timezone.utc)).total_seconds() / 3600 <= self.max_age_hours
-        ]
-
-        # Score all topics
-        for topic in topics:
-            topic.virality_score = self.score_topic(topic, topics)
+        # Compute topic ages once against a single clock read, then filter by age
+        now_ts = datetime.now(timezone.utc).timestamp()
+        aged = [(t, self._topic_hours_old(t, now_ts)) for t in topics]
+        aged = [(t, h) for t, h in aged if h is None or h <= self.max_age_hours]
+        topics = [t for t, _ in aged]
+
+        # Two-pass scoring: the four cheap sub-scores run vectorized over the
+        # whole batch, then an upper bound assuming perfect uniqueness prunes
+        # topics that cannot reach min_score, so the overlap pass only pays
+        # for survivors. The 0.005 slack covers final-score rounding.
+        if topics:
+            uniqueness_weight = self.WEIGHTS["uniqueness"]
+            partial = self._partial_scores_batch(topics, [h for _, h in aged])
+            keep = (partial + 100 * uniqueness_weight) >= min_score - 0.005
+            topics = [t for t, k in zip(topics, keep) if k]
+            partial = partial[keep]
+
+        if topics:
+            overlap_fractions = self._max_overlap_fractions(topics)
+            uniqueness = np.maximum(100 - np.asarray(overlap_fractions) * 100, 10)
+            final = np.round(partial + uniqueness * uniqueness_weight, 2)
+            for topic, score in zip(topics, final):
+                topic.virality_score = float(score)
 
         # Filter by minimum score
         topics = [t for t in topics if t.virality_score >= min_score]
 
-        # Sort by virality score
-        topics.sort(key=lambda x: x.virality_score, reverse=True)
-
-        return topics[:limit]
+        # Top-k by virality score: O(N log k) instead of sorting the batch
+        return heapq.nlargest(limit, topics, key=operator.attrgetter("virality_score"))
 
     def deduplicate_topics(self, topics: list[Topic], similarity_threshold: float = 0.6) -> list[Topic]:
-        """Remove duplicate or very similar topics"""
-        unique_topics = []
-
-        for topic in topics:
-            is_duplicate = False
-            title_words = set(topic.title.lower().split())
+        """Remove duplicate or very similar topics.
 
-            for existing in unique_topics:
-                existing_words = set(existing.title.lower().split())
-                overlap = len(title_words & existing_words) / max(len(title_words | existing_words), 1)
+        Exact Jaccard only runs against candidates that share at least one
+        title word, found through a token -> kept-index inverted index, so
+        the common case is a few postings lookups instead of a scan over
+        every kept topic. Replaced topics are tombstoned rather than removed
+        so no O(N) list shuffling happens inside the loop.
+        """
+        kept: list[Optional[Topic]] = []
+        postings: dict[str, list[int]] = {}
 
+        for topic in topics:
+            tokens = topic.title_tokens
+
+            candidates: set[int] = set()
+            for token in tokens:
+                candidates.update(postings.get(token, ()))
+
+            duplicate_of = None
+            for i in sorted(candidates):
+                existing = kept[i]
+                if existing is None:
+                    continue
+                overlap = len(tokens & existing.title_tokens) / max(len(tokens | existing.title_tokens), 1)
                 if overlap >= similarity_threshold:
-                    is_duplicate = True
-                    # Keep the higher-scoring one
-                    if topic.virality_score > existing.virality_score:
-                        unique_topics.remove(existing)
-                        unique_topics.append(topic)
+                    duplicate_of = i
                     break
 
-            if not is_duplicate:
-                unique_topics.append(topic)
+            if duplicate_of is not None:
+                # Keep the higher-scoring representative
+                if topic.virality_score <= kept[duplicate_of].virality_score:
+                    continue
+                kept[duplicate_of] = None
+
+            index = len(kept)
+            kept.append(topic)
+            for token in tokens:
+                postings.setdefault(token, []).append(index)
 
-        return unique_topics
+        return [t for t in kept if t is not None]
 
     def identify_content_format(self, topic: Topic) -> str:
         """Suggest the best content format for a topic"""
-        title_lower = topic.title.lower()
-
-        for keyword, format_type in self.FORMAT_KEYWORDS.items():
-            if keyword in title_lower:
-                return format_type
-
-        # Default based on category
-        category_formats = {
-            ContentCategory.SEO: "guide",
-            ContentCategory.SOCIAL_MEDIA: "listicle",
-            ContentCategory.CONTENT_MARKETING: "guide",
-            ContentCategory.ANALYTICS: "tutorial",
-            ContentCategory.AI_MARKETING: "tool_review",
-            ContentCategory.STARTUP: "case_study",
-        }
+        cached = self._format_cache.get(topic.id) if topic.id else None
+        if cached is not None:
+            return cached
+
+        # One compiled-regex pass over the title; keep the lowest group index
+        # so declaration order still decides between multiple matches
+        best = None
+        for match in self._FMT_RE.finditer(topic.title_lower):
+            index = match.lastindex - 1
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+
+        if best is not None:
+            format_type = self._FMT_TABLE[best]
+        else:
+            # Default based on category
+            format_type = self._CATEGORY_FORMATS.get(topic.category, "blog_post")
 
-        return category_formats.get(topic.category, "blog_post")
+        if topic.id:
+            self._format_cache[topic.id] = format_type
+        return format_type
 
     def generate_content_angles(self, topic: Topic) -> list[str]:
         """Generate potential content angles for a topic"""
@@ -327,21 +510,14 @@ class ContentCurator:
 
     def group_by_category(self, topics: list[Topic]) -> dict[ContentCategory, list[Topic]]:
         """Group topics by their category"""
-        grouped = {}
+        grouped = defaultdict(list)
         for topic in topics:
-            if topic.category not in grouped:
-                grouped[topic.category] = []
             grouped[topic.category].append(topic)
-        return grouped
+        return dict(grouped)
 
     def get_trending_keywords(self, topics: list[Topic], top_n: int = 20) -> list[tuple[str, int]]:
         """Extract most common keywords from topics"""
-        keyword_counts = {}
-
+        keyword_counts = Counter()
         for topic in topics:
-            for kw in topic.keywords:
-                keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
-
-        # Sort by count
-        sorted_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-        return sorted_keywords[:top_n]
+            keyword_counts.update(topic.keywords)
+        return keyword_counts.most_common(top_n)
@@ -2,10 +2,11 @@
 Data models for the viral content research system
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class TrendSource(str, Enum):
@@ -71,6 +72,37 @@ class Topic(BaseModel):
     content_angle: Optional[str] = None
     target_audience: Optional[str] = None
 
+    @field_validator("published_at")
+    @classmethod
+    def _ensure_tz_aware(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Normalize naive timestamps to UTC so consumers never re-attach tzinfo"""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    # Derived text views used repeatedly by curation; cached on first access
+    # since titles don't change after ingestion
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title"""
+        return self.title.lower()
+
+    @cached_property
+    def title_tokens(self) -> frozenset[str]:
+        """Lowercased title words, used for similarity and uniqueness checks"""
+        return frozenset(self.title_lower.split())
+
+    @cached_property
+    def relevance_text(self) -> str:
+        """Lowercased title + description scanned by relevance scoring"""
+        return f"{self.title_lower} {(self.description or '').lower()}"
+
+    @cached_property
+    def relevance_tokens(self) -> frozenset[str]:
+        """Words of relevance_text, used for set-based keyword matching"""
+        return frozenset(self.relevance_text.split())
+
 
 class ContentBrief(BaseModel):
     """A content brief generated from trending topics"""
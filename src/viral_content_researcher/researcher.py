@@ -3,9 +3,12 @@ Main researcher class that orchestrates all scrapers and curation
 """
 
 import asyncio
+import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+import aiohttp
+
 from viral_content_researcher.models import (
     Topic,
     ContentCategory,
@@ -21,6 +24,8 @@ from viral_content_researcher.scrapers import (
     ProductHuntScraper,
 )
 
+log = logging.getLogger(__name__)
+
 
 class ViralContentResearcher:
     """
@@ -51,19 +56,51 @@ class ViralContentResearcher:
         self._scrapers = {}
         self._session: Optional[ResearchSession] = None
 
+        # Shared across all scrapers: one session over one connection pool so
+        # TCP/TLS handshakes are paid once per host, and one semaphore
+        # bounding in-flight requests
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(16)
+
+    def _ensure_connector(self) -> aiohttp.TCPConnector:
+        """Get or create the shared connection pool"""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=8,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+            )
+        return self._connector
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=self._ensure_connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._http_session
+
     def _get_scraper(self, source: TrendSource):
         """Get or create scraper for a source"""
         if source not in self._scrapers:
-            if source == TrendSource.REDDIT:
-                self._scrapers[source] = RedditScraper()
-            elif source == TrendSource.GOOGLE_TRENDS:
-                self._scrapers[source] = GoogleTrendsScraper()
-            elif source == TrendSource.HACKER_NEWS:
-                self._scrapers[source] = HackerNewsScraper()
-            elif source == TrendSource.RSS_FEED:
-                self._scrapers[source] = RSSFeedScraper()
-            elif source == TrendSource.PRODUCT_HUNT:
-                self._scrapers[source] = ProductHuntScraper()
+            scraper_classes = {
+                TrendSource.REDDIT: RedditScraper,
+                TrendSource.GOOGLE_TRENDS: GoogleTrendsScraper,
+                TrendSource.HACKER_NEWS: HackerNewsScraper,
+                TrendSource.RSS_FEED: RSSFeedScraper,
+                TrendSource.PRODUCT_HUNT: ProductHuntScraper,
+            }
+            scraper_class = scraper_classes.get(source)
+            if scraper_class:
+                self._scrapers[source] = scraper_class(
+                    connector=self._ensure_connector(),
+                    semaphore=self._semaphore,
+                    session=self._ensure_session(),
+                )
         return self._scrapers.get(source)
 
     async def _fetch_from_source(
@@ -76,12 +113,11 @@ class ViralContentResearcher:
         if not scraper:
             return []
 
-        try:
-            async with scraper:
-                return await scraper.fetch_trending(limit=limit)
-        except Exception as e:
-            print(f"Error fetching from {source.value}: {e}")
-            return []
+        # Exceptions propagate to the gather(return_exceptions=True) callers,
+        # which log them; catching and print()ing here would serialize the
+        # concurrent scrapes on the stdout lock
+        async with scraper:
+            return await scraper.fetch_trending(limit=limit)
 
     async def research_trending(
         self,
@@ -119,9 +155,11 @@ class ViralContentResearcher:
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for result in results:
+        for source, result in zip(sources_to_query, results):
             if isinstance(result, list):
                 all_topics.extend(result)
+            else:
+                log.warning("fetch failed source=%s", source.value, exc_info=result)
 
         self._session.topics_discovered = len(all_topics)
 
@@ -161,17 +199,23 @@ class ViralContentResearcher:
         sources_to_query = sources or self.sources
         all_topics = []
 
-        for source in sources_to_query:
+        async def _search_source(source: TrendSource) -> list[Topic]:
             scraper = self._get_scraper(source)
             if not scraper:
-                continue
+                return []
+            async with scraper:
+                return await scraper.search(query, limit=25)
 
-            try:
-                async with scraper:
-                    results = await scraper.search(query, limit=25)
-                    all_topics.extend(results)
-            except Exception as e:
-                print(f"Error searching {source.value}: {e}")
+        # Search all sources in parallel; the shared semaphore bounds fan-out
+        results = await asyncio.gather(
+            *(_search_source(s) for s in sources_to_query),
+            return_exceptions=True,
+        )
+        for source, result in zip(sources_to_query, results):
+            if isinstance(result, list):
+                all_topics.extend(result)
+            else:
+                log.warning("search failed source=%s", source.value, exc_info=result)
 
         # Deduplicate and curate
         all_topics = self.curator.deduplicate_topics(all_topics)
@@ -246,13 +290,19 @@ class ViralContentResearcher:
         }
 
     async def close(self):
-        """Close all scraper connections"""
+        """Close all scraper connections, the shared session and the pool"""
         for scraper in self._scrapers.values():
             try:
                 await scraper.close()
             except Exception:
                 pass
 
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+
     async def __aenter__(self):
         return self
 
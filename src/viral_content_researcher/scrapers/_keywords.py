@@ -0,0 +1,30 @@
+"""
+Shared helpers for compiled marketing-keyword matching
+"""
+
+import re
+
+
+def compile_keyword_pattern(keywords) -> tuple[re.Pattern, dict[str, int]]:
+    """Compile a keyword table into a single lookahead alternation.
+
+    Returns the pattern and a keyword -> original-position map. The
+    lookahead keeps matches zero-width so keywords nested inside longer
+    ones are still found, and longest alternatives go first so phrases
+    beat their prefixes.
+    """
+    pattern = re.compile("(?=(" + "|".join(
+        re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)
+    ) + "))")
+    return pattern, {kw: i for i, kw in enumerate(keywords)}
+
+
+def extract_keywords(
+    pattern: re.Pattern,
+    order: dict[str, int],
+    text: str,
+    limit: int = 10,
+) -> list[str]:
+    """All keywords matched in text, in original table order"""
+    found = {m.group(1) for m in pattern.finditer(text)}
+    return sorted(found, key=order.__getitem__)[:limit]
@@ -4,9 +4,10 @@ Base scraper class for all data sources
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Callable, Optional
 import aiohttp
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
 
 from viral_content_researcher.models import Topic, TrendSource
 
@@ -22,29 +23,80 @@ class BaseScraper(ABC):
         api_key: Optional[str] = None,
         rate_limit: int = 60,
         timeout: int = 30,
+        connector: Optional[aiohttp.TCPConnector] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         self.api_key = api_key
         self.rate_limit = rate_limit
         self.timeout = timeout
+        # Shared across scrapers when supplied by the researcher: one session
+        # (and its connector) reuses warm TCP/TLS connections between sources,
+        # and the semaphore bounds total in-flight requests. A standalone
+        # scraper owns its session and closes it itself, and gets its own
+        # bound so batch fetches cannot fan out unchecked.
+        self._connector = connector
+        self._semaphore = semaphore if semaphore is not None else asyncio.Semaphore(16)
+        self._shared_session = session
         self._session: Optional[aiohttp.ClientSession] = None
-        self._request_count = 0
-        self._last_reset = asyncio.get_event_loop().time() if asyncio.get_event_loop().is_running() else 0
+        # Token bucket: starts full, refills fractionally at rate_limit/min;
+        # _last_refill is stamped lazily since the loop may not be running yet
+        self._tokens = float(rate_limit)
+        self._last_refill: Optional[float] = None
 
     async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session"""
+        """Get the shared session, or create an owned one"""
+        if self._shared_session is not None and not self._shared_session.closed:
+            return self._shared_session
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
+            connector = self._connector
+            if connector is None:
+                # Standalone scraper: a keep-alive pool so bursts of per-item
+                # requests (e.g. the HN Firebase fallback) reuse warm
+                # connections to the same host instead of re-handshaking
+                connector = aiohttp.TCPConnector(
+                    limit=16,
+                    limit_per_host=8,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300,
+                )
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
                 headers=self._get_headers(),
+                connector=connector,
+                connector_owner=self._connector is None,
             )
         return self._session
 
     async def close(self):
-        """Close the session"""
+        """Close the owned session; a shared session is the researcher's to close"""
         if self._session and not self._session.closed:
             await self._session.close()
 
+    @staticmethod
+    def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+        """Parse a timestamp string into a tz-aware UTC datetime.
+
+        Tries the C-accelerated datetime.fromisoformat first; only falls back
+        to dateutil's slower general parser for non-ISO formats.
+        """
+        if not value:
+            return None
+
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            try:
+                from dateutil import parser as dateutil_parser
+                parsed = dateutil_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
     def _get_headers(self) -> dict:
         """Get default headers for requests"""
         return {
@@ -52,49 +104,94 @@ class BaseScraper(ABC):
             "Accept": "application/json",
         }
 
-    async def _check_rate_limit(self):
-        """Simple rate limiting"""
-        loop = asyncio.get_event_loop()
-        current_time = loop.time()
+    @staticmethod
+    def _make_topic(**fields) -> Topic:
+        """Build a Topic from trusted, already-typed scraper fields.
 
-        if current_time - self._last_reset >= 60:
-            self._request_count = 0
-            self._last_reset = current_time
+        Uses model_construct to skip per-field validation on the ingestion
+        hot path. The tz guard on published_at is the only Topic validator
+        with an effect here, so it is applied inline.
+        """
+        published = fields.get("published_at")
+        if published is not None and published.tzinfo is None:
+            fields["published_at"] = published.replace(tzinfo=timezone.utc)
+        return Topic.model_construct(**fields)
 
-        if self._request_count >= self.rate_limit:
-            wait_time = 60 - (current_time - self._last_reset)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            self._request_count = 0
-            self._last_reset = loop.time()
+    def _concurrency_gate(self):
+        """Semaphore bounding in-flight requests, shared under the researcher"""
+        return self._semaphore
 
-        self._request_count += 1
+    async def _check_rate_limit(self):
+        """Token-bucket rate limiting.
+
+        Refills fractionally on every call, so requests pace out smoothly at
+        rate_limit/min instead of bursting and then stalling for up to a
+        minute at the window boundary.
+        """
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+        if self._last_refill is not None:
+            self._tokens = min(
+                float(self.rate_limit),
+                self._tokens + (now - self._last_refill) * self.rate_limit / 60,
+            )
+        self._last_refill = now
+
+        if self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) * 60 / self.rate_limit)
+            self._tokens = 1.0
+            self._last_refill = loop.time()
+
+        self._tokens -= 1
+
+    async def _with_retry(self, coro_factory: Callable, attempts: int = 3):
+        """Retry a request coroutine with exponential backoff.
+
+        Client errors (4xx) are raised immediately since retrying them is
+        pointless, except 429, which signals backpressure and is worth the
+        backoff; transport errors and 5xx responses back off 2s, 4s, ...
+        capped at 10s.
+        """
+        for attempt in range(attempts):
+            try:
+                return await coro_factory()
+            except aiohttp.ClientResponseError as e:
+                if (e.status < 500 and e.status != 429) or attempt == attempts - 1:
+                    raise
+            except aiohttp.ClientError:
+                if attempt == attempts - 1:
+                    raise
+            await asyncio.sleep(min(2 * 2**attempt, 10))
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def _fetch(self, url: str, params: Optional[dict] = None) -> dict:
         """Fetch data from URL with retry logic"""
+        return await self._with_retry(lambda: self._do_fetch(url, params))
+
+    async def _do_fetch(self, url: str, params: Optional[dict]) -> dict:
         await self._check_rate_limit()
         session = await self.get_session()
 
-        async with session.get(url, params=params) as response:
-            response.raise_for_status()
-            return await response.json()
+        # Headers go per-request so scraper-specific User-Agents apply even
+        # on the shared session
+        async with self._concurrency_gate():
+            async with session.get(url, params=params, headers=self._get_headers()) as response:
+                response.raise_for_status()
+                # orjson parses large API payloads several times faster than
+                # the stdlib json used by response.json()
+                return orjson.loads(await response.read())
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def _fetch_html(self, url: str, params: Optional[dict] = None) -> str:
         """Fetch HTML content from URL"""
+        return await self._with_retry(lambda: self._do_fetch_html(url, params))
+
+    async def _do_fetch_html(self, url: str, params: Optional[dict]) -> str:
         await self._check_rate_limit()
         session = await self.get_session()
 
-        async with session.get(url, params=params) as response:
-            response.raise_for_status()
-            return await response.text()
+        async with self._concurrency_gate():
+            async with session.get(url, params=params, headers=self._get_headers()) as response:
+                response.raise_for_status()
+                return await response.text()
 
     @abstractmethod
     async def fetch_trending(self, limit: int = 25) -> list[Topic]:
@@ -117,11 +214,11 @@ class BaseScraper(ABC):
         # Shares indicate viral potential
         share_score = min(topic.shares / 20, 25)
 
-        # Recency bonus (newer = more relevant)
+        # Recency bonus (newer = more relevant); published_at is tz-aware by
+        # model validation, so no tzinfo re-attachment is needed here
         recency_score = 0
         if topic.published_at:
-            from datetime import datetime, timezone
-            hours_old = (datetime.now(timezone.utc) - topic.published_at.replace(tzinfo=timezone.utc)).total_seconds() / 3600
+            hours_old = (datetime.now(timezone.utc) - topic.published_at).total_seconds() / 3600
             if hours_old < 6:
                 recency_score = 20
             elif hours_old < 24:
@@ -4,10 +4,37 @@ Google Trends scraper for marketing-related trending topics
 
 from datetime import datetime, timezone
 from typing import Optional
+import asyncio
+import heapq
+import operator
+import re
+import threading
+import time
+from urllib.parse import quote_plus
+import logging
+
+import numpy as np
 
 from viral_content_researcher.scrapers.base import BaseScraper
 from viral_content_researcher.models import Topic, TrendSource, ContentCategory
 
+log = logging.getLogger(__name__)
+
+
+# One TrendReq shared across scraper instances: constructing it sets up a
+# requests.Session, cookies and locale, and sharing keeps that session's
+# keep-alive pool warm between calls
+_PYTRENDS = None
+_PYTRENDS_INIT_LOCK = threading.Lock()
+
+
+def _safe_num(value, default: float) -> float:
+    """Cast a pytrends value to float, defaulting for 'Breakout' and friends"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
 
 class GoogleTrendsScraper(BaseScraper):
     """Scraper for Google Trends data"""
@@ -16,7 +43,7 @@ class GoogleTrendsScraper(BaseScraper):
     base_url = "https://trends.google.com"
 
     # Marketing-related search terms to track
-    MARKETING_TERMS = [
+    MARKETING_TERMS = (
         "digital marketing",
         "SEO",
         "social media marketing",
@@ -31,53 +58,81 @@ class GoogleTrendsScraper(BaseScraper):
         "video marketing",
         "affiliate marketing",
         "ecommerce marketing",
-    ]
+    )
+
+    # Related-topics responses barely change within an hour and the upstream
+    # is slow and flaky, so memoize per (keyword, geo) with a TTL
+    _RELATED_TTL = 3600.0
+
+    # The shared TrendReq mutates payload state between build_payload and the
+    # result call (and its requests.Session is not thread-safe), so every
+    # pytrends interaction runs under this lock
+    _PYTRENDS_LOCK = threading.Lock()
 
     def __init__(self, geo: str = "US", **kwargs):
         super().__init__(**kwargs)
         self.geo = geo
+        # Instance override hook; the module-level singleton is used when unset
         self._pytrends = None
+        self._related_cache: dict[tuple[str, str], tuple[float, list[Topic]]] = {}
+        # Constant per instance; formatted once instead of per topic URL
+        self._geo_suffix = f"&geo={geo}"
+
 
     def _get_pytrends(self):
-        """Lazy load pytrends"""
-        if self._pytrends is None:
-            try:
-                from pytrends.request import TrendReq
-                self._pytrends = TrendReq(hl='en-US', tz=360)
-            except ImportError:
-                raise ImportError("pytrends is required for Google Trends. Install with: pip install pytrends")
-        return self._pytrends
+        """Lazy load the shared pytrends client"""
+        if self._pytrends is not None:
+            return self._pytrends
+
+        global _PYTRENDS
+        if _PYTRENDS is None:
+            with _PYTRENDS_INIT_LOCK:
+                if _PYTRENDS is None:
+                    try:
+                        from pytrends.request import TrendReq
+                    except ImportError:
+                        raise ImportError("pytrends is required for Google Trends. Install with: pip install pytrends")
+                    _PYTRENDS = TrendReq(hl='en-US', tz=360)
+        return _PYTRENDS
+
+    # Category keyword table in priority order, compiled below into a single
+    # alternation with one group per category
+    CATEGORY_KEYWORDS = {
+        ContentCategory.SEO: ("seo", "search engine", "ranking", "backlink"),
+        ContentCategory.SOCIAL_MEDIA: ("social media", "instagram", "tiktok", "facebook", "linkedin"),
+        ContentCategory.EMAIL_MARKETING: ("email", "newsletter"),
+        ContentCategory.CONTENT_MARKETING: ("content", "blog", "copywriting"),
+        ContentCategory.PAID_ADS: ("ppc", "ads", "advertising", "paid"),
+        ContentCategory.ANALYTICS: ("analytics", "data", "metrics"),
+        ContentCategory.BRANDING: ("brand", "branding"),
+        ContentCategory.GROWTH_HACKING: ("growth", "viral", "hack"),
+        ContentCategory.INFLUENCER: ("influencer", "creator"),
+        ContentCategory.VIDEO_MARKETING: ("video", "youtube"),
+        ContentCategory.AI_MARKETING: ("ai", "chatgpt", "automation"),
+        ContentCategory.ECOMMERCE: ("ecommerce", "shopify", "amazon"),
+    }
+
+    # One scan instead of one per category: the lookahead makes matches
+    # zero-width so nested terms are not skipped, and picking the lowest
+    # matched group index reproduces the priority ordering exactly
+    _CATEGORY_RE = re.compile("(?=" + "|".join(
+        f"({'|'.join(map(re.escape, terms))})" for terms in CATEGORY_KEYWORDS.values()
+    ) + ")")
+    _CATEGORY_TABLE = tuple(CATEGORY_KEYWORDS)
 
     def _categorize_keyword(self, keyword: str) -> ContentCategory:
         """Categorize keyword into content category"""
         keyword_lower = keyword.lower()
 
-        if any(term in keyword_lower for term in ["seo", "search engine", "ranking", "backlink"]):
-            return ContentCategory.SEO
-        elif any(term in keyword_lower for term in ["social media", "instagram", "tiktok", "facebook", "linkedin"]):
-            return ContentCategory.SOCIAL_MEDIA
-        elif any(term in keyword_lower for term in ["email", "newsletter"]):
-            return ContentCategory.EMAIL_MARKETING
-        elif any(term in keyword_lower for term in ["content", "blog", "copywriting"]):
-            return ContentCategory.CONTENT_MARKETING
-        elif any(term in keyword_lower for term in ["ppc", "ads", "advertising", "paid"]):
-            return ContentCategory.PAID_ADS
-        elif any(term in keyword_lower for term in ["analytics", "data", "metrics"]):
-            return ContentCategory.ANALYTICS
-        elif any(term in keyword_lower for term in ["brand", "branding"]):
-            return ContentCategory.BRANDING
-        elif any(term in keyword_lower for term in ["growth", "viral", "hack"]):
-            return ContentCategory.GROWTH_HACKING
-        elif any(term in keyword_lower for term in ["influencer", "creator"]):
-            return ContentCategory.INFLUENCER
-        elif any(term in keyword_lower for term in ["video", "youtube"]):
-            return ContentCategory.VIDEO_MARKETING
-        elif any(term in keyword_lower for term in ["ai", "chatgpt", "automation"]):
-            return ContentCategory.AI_MARKETING
-        elif any(term in keyword_lower for term in ["ecommerce", "shopify", "amazon"]):
-            return ContentCategory.ECOMMERCE
-
-        return ContentCategory.GENERAL
+        best = None
+        for match in self._CATEGORY_RE.finditer(keyword_lower):
+            group = match.lastindex - 1
+            if group == 0:
+                return self._CATEGORY_TABLE[0]
+            if best is None or group < best:
+                best = group
+
+        return self._CATEGORY_TABLE[best] if best is not None else ContentCategory.GENERAL
 
     async def fetch_trending(self, limit: int = 25) -> list[Topic]:
         """Fetch trending searches from Google Trends"""
@@ -86,75 +141,105 @@ class GoogleTrendsScraper(BaseScraper):
         try:
             pytrends = self._get_pytrends()
 
-            # Get daily trending searches
-            trending_df = pytrends.trending_searches(pn='united_states')
-
-            for idx, row in trending_df.head(limit).iterrows():
-                query = row[0]
-
-                # Check if it's marketing-related
-                is_marketing = self._is_marketing_related(query)
-
-                topic = Topic(
+            def _trending():
+                with self._PYTRENDS_LOCK:
+                    return pytrends.trending_searches(pn='united_states')
+
+            # Get daily trending searches, off the event loop
+            trending_df = await asyncio.to_thread(_trending)
+
+            queries = trending_df.iloc[:limit, 0].tolist()
+
+            # Rank-derived scores in one vectorized shot; higher rank =
+            # higher score, with a boost for marketing-related terms
+            rank = np.arange(len(queries))
+            scores = 100 - rank
+            is_marketing = np.fromiter(
+                (self._is_marketing_related(q) for q in queries),
+                dtype=bool, count=len(queries),
+            )
+            virality = np.where(
+                is_marketing,
+                np.minimum(80 + (25 - rank), 100),
+                np.maximum(50 - rank, 10),
+            )
+
+            now = datetime.now(timezone.utc)
+            for idx, query in enumerate(queries):
+                topic = self._make_topic(
                     id=f"gt_{idx}",
                     title=query,
                     description=f"Trending search: {query}",
-                    url=f"https://trends.google.com/trends/explore?q={query.replace(' ', '%20')}&geo={self.geo}",
+                    url="https://trends.google.com/trends/explore?q=" + quote_plus(query) + self._geo_suffix,
                     source=TrendSource.GOOGLE_TRENDS,
-                    category=self._categorize_keyword(query) if is_marketing else ContentCategory.GENERAL,
-                    score=100 - idx,  # Higher rank = higher score
-                    published_at=datetime.now(timezone.utc),
+                    category=self._categorize_keyword(query) if is_marketing[idx] else ContentCategory.GENERAL,
+                    score=int(scores[idx]),
+                    published_at=now,
                     keywords=[query.lower()],
+                    virality_score=float(virality[idx]),
                 )
-
-                # Boost score for marketing-related terms
-                if is_marketing:
-                    topic.virality_score = min(80 + (25 - idx), 100)
-                else:
-                    topic.virality_score = max(50 - idx, 10)
-
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching Google Trends: {e}")
+        except Exception:
+            log.warning("fetch failed", exc_info=True)
 
         return topics
 
     async def fetch_related_topics(self, keyword: str) -> list[Topic]:
         """Fetch related trending topics for a keyword"""
+        cache_key = (keyword, self.geo)
+        cached = self._related_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._RELATED_TTL:
+            return list(cached[1])
+
         topics = []
 
         try:
             pytrends = self._get_pytrends()
-            pytrends.build_payload([keyword], timeframe='now 7-d', geo=self.geo)
 
-            related = pytrends.related_topics()
+            def _related():
+                with self._PYTRENDS_LOCK:
+                    pytrends.build_payload([keyword], timeframe='now 7-d', geo=self.geo)
+                    return pytrends.related_topics()
+
+            # pytrends is blocking requests under the hood; run it off the
+            # event loop so other scrapers keep making progress
+            related = await asyncio.to_thread(_related)
 
             if keyword in related and 'rising' in related[keyword]:
                 rising_df = related[keyword]['rising']
 
                 if rising_df is not None and not rising_df.empty:
-                    for idx, row in rising_df.iterrows():
-                        topic_title = row.get('topic_title', row.get('query', ''))
-
-                        topic = Topic(
+                    # itertuples avoids building a Series per row; resolve
+                    # column positions once since pytrends frames vary
+                    cols = rising_df.columns
+                    title_pos = next((cols.get_loc(c) for c in ('topic_title', 'query') if c in cols), None)
+                    value_pos = cols.get_loc('value') if 'value' in cols else None
+                    now = datetime.now(timezone.utc)
+
+                    for idx, row in enumerate(rising_df.itertuples(index=False, name=None)):
+                        topic_title = row[title_pos] if title_pos is not None else ''
+                        value = _safe_num(row[value_pos], 50) if value_pos is not None else 50.0
+
+                        topic = self._make_topic(
                             id=f"gt_rel_{idx}",
                             title=topic_title,
                             description=f"Rising topic related to '{keyword}'",
-                            url=f"https://trends.google.com/trends/explore?q={topic_title.replace(' ', '%20')}&geo={self.geo}",
+                            url="https://trends.google.com/trends/explore?q=" + quote_plus(topic_title) + self._geo_suffix,
                             source=TrendSource.GOOGLE_TRENDS,
                             category=self._categorize_keyword(topic_title),
-                            score=int(row.get('value', 0)) if str(row.get('value', '')).isdigit() else 50,
+                            score=int(value),
                             keywords=[keyword.lower(), topic_title.lower()],
-                            published_at=datetime.now(timezone.utc),
+                            published_at=now,
+                            virality_score=min(value, 100),
                         )
-
-                        topic.virality_score = min(float(row.get('value', 50)), 100) if str(row.get('value', '')).replace('.', '').isdigit() else 50
                         topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching related topics for '{keyword}': {e}")
+        except Exception:
+            log.warning("related-topics fetch failed keyword=%s", keyword, exc_info=True)
+            return topics
 
+        self._related_cache[cache_key] = (time.monotonic(), list(topics))
         return topics
 
     async def search(self, query: str, limit: int = 25) -> list[Topic]:
@@ -163,87 +248,110 @@ class GoogleTrendsScraper(BaseScraper):
 
         try:
             pytrends = self._get_pytrends()
-            pytrends.build_payload([query], timeframe='now 7-d', geo=self.geo)
 
-            # Get related queries
-            related_queries = pytrends.related_queries()
+            def _related_queries():
+                with self._PYTRENDS_LOCK:
+                    pytrends.build_payload([query], timeframe='now 7-d', geo=self.geo)
+                    return pytrends.related_queries()
+
+            related_queries = await asyncio.to_thread(_related_queries)
+
+            # One timestamp shared by every row built below
+            now = datetime.now(timezone.utc)
 
             if query in related_queries:
                 # Rising queries
                 if 'rising' in related_queries[query] and related_queries[query]['rising'] is not None:
                     rising_df = related_queries[query]['rising']
-                    for idx, row in rising_df.head(limit // 2).iterrows():
-                        related_query = row.get('query', '')
-                        topic = Topic(
+                    cols = rising_df.columns
+                    query_pos = cols.get_loc('query') if 'query' in cols else None
+                    value_pos = cols.get_loc('value') if 'value' in cols else None
+                    for idx, row in enumerate(rising_df.head(limit // 2).itertuples(index=False, name=None)):
+                        related_query = row[query_pos] if query_pos is not None else ''
+                        value = row[value_pos] if value_pos is not None else 'Breakout'
+                        topic = self._make_topic(
                             id=f"gt_search_rising_{idx}",
                             title=related_query,
-                            description=f"Rising search related to '{query}' - {row.get('value', 'Breakout')}% increase",
-                            url=f"https://trends.google.com/trends/explore?q={related_query.replace(' ', '%20')}&geo={self.geo}",
+                            description=f"Rising search related to '{query}' - {value}% increase",
+                            url="https://trends.google.com/trends/explore?q=" + quote_plus(related_query) + self._geo_suffix,
                             source=TrendSource.GOOGLE_TRENDS,
                             category=self._categorize_keyword(related_query),
                             keywords=[query.lower(), related_query.lower()],
-                            published_at=datetime.now(timezone.utc),
+                            published_at=now,
+                            virality_score=75,
                         )
-                        topic.virality_score = 75
                         topics.append(topic)
 
                 # Top queries
                 if 'top' in related_queries[query] and related_queries[query]['top'] is not None:
                     top_df = related_queries[query]['top']
-                    for idx, row in top_df.head(limit // 2).iterrows():
-                        related_query = row.get('query', '')
-                        topic = Topic(
+                    query_pos = top_df.columns.get_loc('query') if 'query' in top_df.columns else None
+                    for idx, row in enumerate(top_df.head(limit // 2).itertuples(index=False, name=None)):
+                        related_query = row[query_pos] if query_pos is not None else ''
+                        topic = self._make_topic(
                             id=f"gt_search_top_{idx}",
                             title=related_query,
                             description=f"Top search related to '{query}'",
-                            url=f"https://trends.google.com/trends/explore?q={related_query.replace(' ', '%20')}&geo={self.geo}",
+                            url="https://trends.google.com/trends/explore?q=" + quote_plus(related_query) + self._geo_suffix,
                             source=TrendSource.GOOGLE_TRENDS,
                             category=self._categorize_keyword(related_query),
                             keywords=[query.lower(), related_query.lower()],
-                            published_at=datetime.now(timezone.utc),
+                            published_at=now,
+                            virality_score=60,
                         )
-                        topic.virality_score = 60
                         topics.append(topic)
 
-        except Exception as e:
-            print(f"Error searching Google Trends for '{query}': {e}")
+        except Exception:
+            log.warning("search failed query=%s", query, exc_info=True)
 
         return topics[:limit]
 
+    MARKETING_INDICATORS = (
+        "marketing", "seo", "ads", "advertising", "social media",
+        "brand", "campaign", "content", "digital", "email",
+        "influencer", "viral", "growth", "conversion", "traffic",
+        "analytics", "roi", "ppc", "cpc", "engagement", "audience",
+        "funnel", "leads", "sales", "ecommerce", "shopify",
+        "facebook", "instagram", "tiktok", "linkedin", "twitter",
+        "youtube", "google", "ai", "automation", "saas", "startup",
+    )
+
+    _MARKETING_RE = re.compile("|".join(map(re.escape, MARKETING_INDICATORS)))
+
     def _is_marketing_related(self, text: str) -> bool:
         """Check if text is related to marketing"""
-        marketing_indicators = [
-            "marketing", "seo", "ads", "advertising", "social media",
-            "brand", "campaign", "content", "digital", "email",
-            "influencer", "viral", "growth", "conversion", "traffic",
-            "analytics", "roi", "ppc", "cpc", "engagement", "audience",
-            "funnel", "leads", "sales", "ecommerce", "shopify",
-            "facebook", "instagram", "tiktok", "linkedin", "twitter",
-            "youtube", "google", "ai", "automation", "saas", "startup",
-        ]
-
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in marketing_indicators)
+        return self._MARKETING_RE.search(text.lower()) is not None
 
     async def get_marketing_trends(self, limit: int = 25) -> list[Topic]:
         """Get trends specifically for marketing-related terms"""
         all_topics = []
 
-        for term in self.MARKETING_TERMS[:5]:  # Limit API calls
-            try:
-                related = await self.fetch_related_topics(term)
+        # Fire the (worker-thread) lookups together, at most three queued
+        # against the shared client at once and each capped at 10s since the
+        # upstream occasionally hangs; failures and timeouts drop out of the
+        # result list rather than aborting the batch
+        sem = asyncio.Semaphore(3)
+
+        async def _bounded(term: str) -> list[Topic]:
+            async with sem:
+                return await asyncio.wait_for(self.fetch_related_topics(term), timeout=10)
+
+        results = await asyncio.gather(
+            *(_bounded(term) for term in self.MARKETING_TERMS[:5]),
+            return_exceptions=True,
+        )
+        for related in results:
+            if isinstance(related, list):
                 all_topics.extend(related)
-            except Exception:
-                continue
 
-        # Deduplicate by title
+        # Deduplicate by title, lowering each one once via the cached view
         seen_titles = set()
         unique_topics = []
         for topic in all_topics:
-            if topic.title.lower() not in seen_titles:
-                seen_titles.add(topic.title.lower())
+            title_lower = topic.title_lower
+            if title_lower not in seen_titles:
+                seen_titles.add(title_lower)
                 unique_topics.append(topic)
 
-        # Sort by virality score
-        unique_topics.sort(key=lambda x: x.virality_score, reverse=True)
-        return unique_topics[:limit]
+        # Top-k by virality score without sorting the whole batch
+        return heapq.nlargest(limit, unique_topics, key=operator.attrgetter("virality_score"))
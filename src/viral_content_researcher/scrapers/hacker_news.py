@@ -5,19 +5,41 @@ Hacker News scraper for tech and startup marketing insights
 from datetime import datetime, timezone
 from typing import Optional
 import asyncio
+import heapq
+import logging
+import operator
+import re
+import time
+
+import numpy as np
 
 from viral_content_researcher.scrapers.base import BaseScraper
+from viral_content_researcher.scrapers._keywords import compile_keyword_pattern, extract_keywords
 from viral_content_researcher.models import Topic, TrendSource, ContentCategory
 
+log = logging.getLogger(__name__)
+
+_UTC = timezone.utc
+
 
 class HackerNewsScraper(BaseScraper):
     """Scraper for Hacker News stories"""
 
     source = TrendSource.HACKER_NEWS
     base_url = "https://hacker-news.firebaseio.com/v0"
+    algolia_url = "https://hn.algolia.com/api/v1"
+
+    # Item JSON is immutable enough over minutes that repeat fetches of
+    # the same story id across fetch_trending/fetch_new/fetch_show_hn can
+    # short-circuit the network on the Firebase fallback path
+    _STORY_TTL = 300.0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._story_cache: dict[int, tuple[float, dict]] = {}
 
     # Keywords that indicate marketing-relevant content
-    MARKETING_KEYWORDS = [
+    MARKETING_KEYWORDS = (
         "marketing", "seo", "growth", "startup", "saas", "b2b",
         "advertising", "ads", "conversion", "analytics", "metrics",
         "customer", "acquisition", "retention", "churn", "viral",
@@ -25,117 +47,180 @@ class HackerNewsScraper(BaseScraper):
         "newsletter", "audience", "engagement", "traffic", "leads",
         "sales", "revenue", "pricing", "launch", "product hunt",
         "ai", "automation", "personalization", "ecommerce", "shopify",
-    ]
-
-    def _categorize_content(self, title: str) -> ContentCategory:
-        """Categorize HN story by title"""
-        title_lower = title.lower()
-
-        if any(term in title_lower for term in ["seo", "search engine", "google ranking"]):
-            return ContentCategory.SEO
-        elif any(term in title_lower for term in ["social media", "twitter", "linkedin", "tiktok"]):
-            return ContentCategory.SOCIAL_MEDIA
-        elif any(term in title_lower for term in ["email", "newsletter"]):
-            return ContentCategory.EMAIL_MARKETING
-        elif any(term in title_lower for term in ["content", "blog", "writing"]):
-            return ContentCategory.CONTENT_MARKETING
-        elif any(term in title_lower for term in ["ads", "advertising", "ppc"]):
-            return ContentCategory.PAID_ADS
-        elif any(term in title_lower for term in ["analytics", "metrics", "data"]):
-            return ContentCategory.ANALYTICS
-        elif any(term in title_lower for term in ["growth", "viral", "hack"]):
-            return ContentCategory.GROWTH_HACKING
-        elif any(term in title_lower for term in ["ai", "chatgpt", "llm", "automation"]):
-            return ContentCategory.AI_MARKETING
-        elif any(term in title_lower for term in ["startup", "launch", "founder"]):
-            return ContentCategory.STARTUP
-        elif any(term in title_lower for term in ["saas", "b2b", "enterprise"]):
-            return ContentCategory.B2B
-        elif any(term in title_lower for term in ["ecommerce", "shopify", "amazon"]):
-            return ContentCategory.ECOMMERCE
-
-        return ContentCategory.GENERAL
-
-    def _is_marketing_relevant(self, title: str, url: str = "") -> bool:
-        """Check if story is relevant to marketing"""
-        text = f"{title} {url}".lower()
-        return any(kw in text for kw in self.MARKETING_KEYWORDS)
-
-    def _extract_keywords(self, title: str) -> list[str]:
-        """Extract keywords from title"""
-        found = []
-        title_lower = title.lower()
-
-        for kw in self.MARKETING_KEYWORDS:
-            if kw in title_lower:
-                found.append(kw)
-
-        return found[:10]
+    )
+
+    # Category keyword table in priority order, compiled below into a single
+    # alternation with one group per category
+    CATEGORY_KEYWORDS = {
+        ContentCategory.SEO: ("seo", "search engine", "google ranking"),
+        ContentCategory.SOCIAL_MEDIA: ("social media", "twitter", "linkedin", "tiktok"),
+        ContentCategory.EMAIL_MARKETING: ("email", "newsletter"),
+        ContentCategory.CONTENT_MARKETING: ("content", "blog", "writing"),
+        ContentCategory.PAID_ADS: ("ads", "advertising", "ppc"),
+        ContentCategory.ANALYTICS: ("analytics", "metrics", "data"),
+        ContentCategory.GROWTH_HACKING: ("growth", "viral", "hack"),
+        ContentCategory.AI_MARKETING: ("ai", "chatgpt", "llm", "automation"),
+        ContentCategory.STARTUP: ("startup", "launch", "founder"),
+        ContentCategory.B2B: ("saas", "b2b", "enterprise"),
+        ContentCategory.ECOMMERCE: ("ecommerce", "shopify", "amazon"),
+    }
+
+    # One scan instead of one per category: the lookahead makes matches
+    # zero-width so nested terms are not skipped, and picking the lowest
+    # matched group index reproduces the priority ordering exactly
+    _CATEGORY_RE = re.compile("(?=" + "|".join(
+        f"({'|'.join(map(re.escape, terms))})" for terms in CATEGORY_KEYWORDS.values()
+    ) + ")")
+    _CATEGORY_TABLE = tuple(CATEGORY_KEYWORDS)
+
+    _MARKETING_RE = re.compile("|".join(map(re.escape, MARKETING_KEYWORDS)))
+
+    _KEYWORD_RE, _KEYWORD_ORDER = compile_keyword_pattern(MARKETING_KEYWORDS)
+
+    # The three matchers take already-lowercased text so each fetch loop
+    # lowers a story's title (and url) exactly once
+
+    def _categorize_content(self, title_lower: str) -> ContentCategory:
+        """Categorize HN story by its lowercased title"""
+        best = None
+        for match in self._CATEGORY_RE.finditer(title_lower):
+            group = match.lastindex - 1
+            if group == 0:
+                return self._CATEGORY_TABLE[0]
+            if best is None or group < best:
+                best = group
+
+        return self._CATEGORY_TABLE[best] if best is not None else ContentCategory.GENERAL
+
+    def _is_marketing_relevant(self, title_lower: str, url: str = "") -> bool:
+        """Check if story is relevant to marketing.
+
+        Titles identify most marketing stories, so the (often long) URL is
+        only lowercased and scanned when the title misses.
+        """
+        if self._MARKETING_RE.search(title_lower) is not None:
+            return True
+        return bool(url) and self._MARKETING_RE.search(url.lower()) is not None
+
+    def _extract_keywords(self, title_lower: str) -> list[str]:
+        """Extract keywords from a lowercased title"""
+        return extract_keywords(self._KEYWORD_RE, self._KEYWORD_ORDER, title_lower)
 
     async def _get_story(self, story_id: int) -> Optional[dict]:
-        """Fetch a single story by ID"""
+        """Fetch a single story by ID, memoized with a short TTL"""
+        cached = self._story_cache.get(story_id)
+        if cached is not None and time.monotonic() - cached[0] < self._STORY_TTL:
+            return cached[1]
+
         try:
             url = f"{self.base_url}/item/{story_id}.json"
-            return await self._fetch(url)
+            story = await self._fetch(url)
         except Exception:
             return None
 
+        self._story_cache[story_id] = (time.monotonic(), story)
+        return story
+
+    @staticmethod
+    def _hit_to_story(hit: dict) -> dict:
+        """Normalize an Algolia search hit to the Firebase item shape"""
+        return {
+            "id": hit.get("objectID"),
+            "type": "story",
+            "title": hit.get("title") or "",
+            "url": hit.get("url") or "",
+            "score": hit.get("points") or 0,
+            "descendants": hit.get("num_comments") or 0,
+            "by": hit.get("author"),
+            "time": hit.get("created_at_i") or 0,
+        }
+
+    async def _algolia_stories(self, endpoint: str, tags: str, count: int) -> list[dict]:
+        """Fetch a batch of stories with one Algolia call.
+
+        One request and one JSON parse replace the Firebase pattern of a
+        story-id listing plus a request per story.
+        """
+        data = await self._fetch(
+            f"{self.algolia_url}/{endpoint}",
+            {"tags": tags, "hitsPerPage": count},
+        )
+        return [self._hit_to_story(hit) for hit in data.get("hits", [])]
+
+    async def _firebase_stories(self, endpoint: str, count: int) -> list[dict]:
+        """Fallback: fetch story ids then items from the Firebase API"""
+        story_ids = await self._fetch(f"{self.base_url}/{endpoint}")
+        tasks = [self._get_story(sid) for sid in story_ids[:count]]
+        stories = await asyncio.gather(*tasks)
+        return [s for s in stories if s]
+
     async def fetch_trending(self, limit: int = 25) -> list[Topic]:
         """Fetch top stories from Hacker News"""
         topics = []
 
         try:
-            # Get top story IDs
-            url = f"{self.base_url}/topstories.json"
-            story_ids = await self._fetch(url)
-
-            # Fetch stories in parallel (batched)
-            batch_size = 30
-            stories_to_fetch = story_ids[:batch_size * 2]  # Fetch more to filter
-
-            tasks = [self._get_story(sid) for sid in stories_to_fetch]
-            stories = await asyncio.gather(*tasks)
-
-            for story in stories:
-                if not story or story.get("type") != "story":
-                    continue
-
+            try:
+                stories = await self._algolia_stories("search", "front_page", limit * 2)
+            except Exception:
+                stories = await self._firebase_stories("topstories.json", limit * 2)
+
+            stories = [s for s in stories if s and s.get("type") == "story"]
+            titles_lower = [s.get("title", "").lower() for s in stories]
+
+            # Virality for the whole batch in a few vectorized expressions
+            # instead of a calculate_virality_score call per story; shares
+            # are always 0 for HN so that term drops out
+            now = datetime.now(timezone.utc)
+            scores = np.array([s.get("score", 0) for s in stories], dtype=np.float64)
+            comments = np.array([s.get("descendants", 0) for s in stories], dtype=np.float64)
+            times = np.array([s.get("time", 0) for s in stories], dtype=np.float64)
+            hours_old = (now.timestamp() - times) / 3600
+            recency = np.select(
+                [hours_old < 6, hours_old < 24, hours_old < 48, hours_old < 72],
+                [20, 15, 10, 5],
+                default=0,
+            )
+            virality = np.minimum(
+                np.minimum(scores / 100, 30) + np.minimum(comments / 50, 25) + recency,
+                100,
+            )
+
+            # Boost marketing-relevant content
+            is_marketing = np.fromiter(
+                (
+                    self._is_marketing_relevant(tl, s.get("url", ""))
+                    for tl, s in zip(titles_lower, stories)
+                ),
+                dtype=bool, count=len(stories),
+            )
+            virality = np.where(is_marketing, np.minimum(virality * 1.3, 100), virality)
+
+            for idx, story in enumerate(stories):
                 title = story.get("title", "")
                 story_url = story.get("url", "")
+                title_lower = titles_lower[idx]
 
-                # Filter for marketing relevance (optional - can be disabled for broader results)
-                # is_relevant = self._is_marketing_relevant(title, story_url)
-
-                topic = Topic(
+                topic = self._make_topic(
                     id=str(story.get("id")),
                     title=title,
                     description=f"HN discussion with {story.get('descendants', 0)} comments",
                     url=story_url or f"https://news.ycombinator.com/item?id={story.get('id')}",
                     source=TrendSource.HACKER_NEWS,
-                    category=self._categorize_content(title),
+                    category=self._categorize_content(title_lower),
                     score=story.get("score", 0),
                     comments=story.get("descendants", 0),
                     author=story.get("by"),
-                    published_at=datetime.fromtimestamp(
-                        story.get("time", 0),
-                        tz=timezone.utc
-                    ),
-                    keywords=self._extract_keywords(title),
+                    published_at=datetime.fromtimestamp(story.get("time", 0), _UTC),
+                    keywords=self._extract_keywords(title_lower),
+                    virality_score=float(virality[idx]),
                 )
-
-                topic.virality_score = self.calculate_virality_score(topic)
-
-                # Boost marketing-relevant content
-                if self._is_marketing_relevant(title, story_url):
-                    topic.virality_score = min(topic.virality_score * 1.3, 100)
-
                 topics.append(topic)
 
-            # Sort by virality score
-            topics.sort(key=lambda x: x.virality_score, reverse=True)
+            # Only limit stories are returned, so top-k beats a full sort
+            return heapq.nlargest(limit, topics, key=operator.attrgetter("virality_score"))
 
-        except Exception as e:
-            print(f"Error fetching HN stories: {e}")
+        except Exception:
+            log.warning("fetch failed", exc_info=True)
 
         return topics[:limit]
 
@@ -144,11 +229,10 @@ class HackerNewsScraper(BaseScraper):
         topics = []
 
         try:
-            url = f"{self.base_url}/newstories.json"
-            story_ids = await self._fetch(url)
-
-            tasks = [self._get_story(sid) for sid in story_ids[:limit * 2]]
-            stories = await asyncio.gather(*tasks)
+            try:
+                stories = await self._algolia_stories("search_by_date", "story", limit * 2)
+            except Exception:
+                stories = await self._firebase_stories("newstories.json", limit * 2)
 
             for story in stories:
                 if not story or story.get("type") != "story":
@@ -156,28 +240,26 @@ class HackerNewsScraper(BaseScraper):
 
                 title = story.get("title", "")
                 story_url = story.get("url", "")
+                title_lower = title.lower()
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=str(story.get("id")),
                     title=title,
                     url=story_url or f"https://news.ycombinator.com/item?id={story.get('id')}",
                     source=TrendSource.HACKER_NEWS,
-                    category=self._categorize_content(title),
+                    category=self._categorize_content(title_lower),
                     score=story.get("score", 0),
                     comments=story.get("descendants", 0),
                     author=story.get("by"),
-                    published_at=datetime.fromtimestamp(
-                        story.get("time", 0),
-                        tz=timezone.utc
-                    ),
-                    keywords=self._extract_keywords(title),
+                    published_at=datetime.fromtimestamp(story.get("time", 0), _UTC),
+                    keywords=self._extract_keywords(title_lower),
                 )
 
                 topic.virality_score = self.calculate_virality_score(topic)
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching new HN stories: {e}")
+        except Exception:
+            log.warning("new-stories fetch failed", exc_info=True)
 
         return topics[:limit]
 
@@ -187,41 +269,38 @@ class HackerNewsScraper(BaseScraper):
 
         try:
             # Use HN Algolia Search API
-            url = "https://hn.algolia.com/api/v1/search"
-            params = {
-                "query": query,
-                "tags": "story",
-                "hitsPerPage": limit,
-            }
-
-            session = await self.get_session()
-            async with session.get(url, params=params) as response:
-                data = await response.json()
+            data = await self._fetch(
+                f"{self.algolia_url}/search",
+                {"query": query, "tags": "story", "hitsPerPage": limit},
+            )
 
             for hit in data.get("hits", []):
                 title = hit.get("title", "")
+                title_lower = title.lower()
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=str(hit.get("objectID")),
                     title=title,
                     description=f"Search result for '{query}'",
                     url=hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID')}",
                     source=TrendSource.HACKER_NEWS,
-                    category=self._categorize_content(title),
+                    category=self._categorize_content(title_lower),
                     score=hit.get("points", 0),
                     comments=hit.get("num_comments", 0),
                     author=hit.get("author"),
-                    published_at=datetime.fromisoformat(
-                        hit.get("created_at", "").replace("Z", "+00:00")
-                    ) if hit.get("created_at") else None,
-                    keywords=self._extract_keywords(title),
+                    # created_at_i is the same moment as the created_at ISO
+                    # string, without the string replace and ISO parse per hit
+                    published_at=datetime.fromtimestamp(
+                        hit["created_at_i"], _UTC
+                    ) if hit.get("created_at_i") else None,
+                    keywords=self._extract_keywords(title_lower),
                 )
 
                 topic.virality_score = self.calculate_virality_score(topic)
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error searching HN: {e}")
+        except Exception:
+            log.warning("search failed query=%s", query, exc_info=True)
 
         return topics
 
@@ -230,11 +309,10 @@ class HackerNewsScraper(BaseScraper):
         topics = []
 
         try:
-            url = f"{self.base_url}/showstories.json"
-            story_ids = await self._fetch(url)
-
-            tasks = [self._get_story(sid) for sid in story_ids[:limit * 2]]
-            stories = await asyncio.gather(*tasks)
+            try:
+                stories = await self._algolia_stories("search", "show_hn", limit * 2)
+            except Exception:
+                stories = await self._firebase_stories("showstories.json", limit * 2)
 
             for story in stories:
                 if not story:
@@ -242,8 +320,9 @@ class HackerNewsScraper(BaseScraper):
 
                 title = story.get("title", "")
                 story_url = story.get("url", "")
+                title_lower = title.lower()
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=str(story.get("id")),
                     title=title,
                     description="Show HN - Product/Project Launch",
@@ -253,17 +332,14 @@ class HackerNewsScraper(BaseScraper):
                     score=story.get("score", 0),
                     comments=story.get("descendants", 0),
                     author=story.get("by"),
-                    published_at=datetime.fromtimestamp(
-                        story.get("time", 0),
-                        tz=timezone.utc
-                    ),
-                    keywords=self._extract_keywords(title) + ["show hn", "launch"],
+                    published_at=datetime.fromtimestamp(story.get("time", 0), _UTC),
+                    keywords=self._extract_keywords(title_lower) + ["show hn", "launch"],
                 )
 
                 topic.virality_score = self.calculate_virality_score(topic)
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching Show HN: {e}")
+        except Exception:
+            log.warning("show-hn fetch failed", exc_info=True)
 
         return topics[:limit]
@@ -3,12 +3,52 @@ Product Hunt scraper for marketing tools and trending products
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
+import asyncio
+import heapq
+import logging
+import operator
+import re
+
 from bs4 import BeautifulSoup
 
+# lxml parses PH-sized pages several times faster than html.parser and keeps
+# the href substring match in C; BeautifulSoup stays as the fallback parser.
+# The selectors are compiled once so each page pays evaluation, not parsing,
+# of the expression.
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    _POST_LINK_SEL = etree.XPath('.//a[contains(@href, "/posts/")]')
+    _DATA_TEST_SEL = etree.XPath('.//div[@data-test] | .//article[@data-test]')
+except ImportError:
+    lxml_html = None
+
 from viral_content_researcher.scrapers.base import BaseScraper
+from viral_content_researcher.scrapers._keywords import compile_keyword_pattern, extract_keywords
 from viral_content_researcher.models import Topic, TrendSource, ContentCategory
 
+log = logging.getLogger(__name__)
+
+
+def _soup_post_links(soup: BeautifulSoup) -> list[tuple[str, str]]:
+    return [
+        (a.get("href") or "", a.get_text(strip=True))
+        for a in soup.find_all("a", href=lambda x: x and "/posts/" in x)
+    ]
+
+
+def _post_links(html: str) -> list[tuple[str, str]]:
+    """Extract (href, text) pairs for product post links"""
+    if lxml_html is not None:
+        tree = lxml_html.document_fromstring(html)
+        return [
+            (a.get("href") or "", a.text_content().strip())
+            for a in _POST_LINK_SEL(tree)
+        ]
+    return _soup_post_links(BeautifulSoup(html, "html.parser"))
+
 
 class ProductHuntScraper(BaseScraper):
     """Scraper for Product Hunt launches"""
@@ -42,54 +82,62 @@ class ProductHuntScraper(BaseScraper):
             "Accept-Language": "en-US,en;q=0.5",
         }
 
+    # Category keyword table in priority order, compiled below into a single
+    # alternation with one group per category
+    CATEGORY_KEYWORDS = {
+        ContentCategory.SEO: ("seo", "search engine", "ranking", "backlink"),
+        ContentCategory.SOCIAL_MEDIA: ("social media", "instagram", "tiktok", "twitter", "linkedin"),
+        ContentCategory.EMAIL_MARKETING: ("email", "newsletter", "outreach"),
+        ContentCategory.CONTENT_MARKETING: ("content", "blog", "writing", "copywriting"),
+        ContentCategory.PAID_ADS: ("ads", "advertising", "ppc", "campaign"),
+        ContentCategory.ANALYTICS: ("analytics", "metrics", "data", "dashboard"),
+        ContentCategory.GROWTH_HACKING: ("growth", "viral", "acquisition"),
+        ContentCategory.INFLUENCER: ("influencer", "creator", "ugc"),
+        ContentCategory.VIDEO_MARKETING: ("video", "youtube", "reels"),
+        ContentCategory.AI_MARKETING: ("ai", "chatgpt", "automation", "gpt"),
+        ContentCategory.ECOMMERCE: ("ecommerce", "shopify", "store", "commerce"),
+        ContentCategory.B2B: ("saas", "b2b", "enterprise"),
+    }
+
+    # One scan instead of one per category: the lookahead makes matches
+    # zero-width so nested terms are not skipped, and picking the lowest
+    # matched group index reproduces the priority ordering exactly
+    _CATEGORY_RE = re.compile("(?=" + "|".join(
+        f"({'|'.join(map(re.escape, terms))})" for terms in CATEGORY_KEYWORDS.values()
+    ) + ")")
+    _CATEGORY_TABLE = tuple(CATEGORY_KEYWORDS)
+
     def _categorize_product(self, name: str, tagline: str, topics: list[str]) -> ContentCategory:
         """Categorize a product based on its info"""
-        text = f"{name} {tagline} {' '.join(topics)}".lower()
-
-        if any(term in text for term in ["seo", "search engine", "ranking", "backlink"]):
-            return ContentCategory.SEO
-        elif any(term in text for term in ["social media", "instagram", "tiktok", "twitter", "linkedin"]):
-            return ContentCategory.SOCIAL_MEDIA
-        elif any(term in text for term in ["email", "newsletter", "outreach"]):
-            return ContentCategory.EMAIL_MARKETING
-        elif any(term in text for term in ["content", "blog", "writing", "copywriting"]):
-            return ContentCategory.CONTENT_MARKETING
-        elif any(term in text for term in ["ads", "advertising", "ppc", "campaign"]):
-            return ContentCategory.PAID_ADS
-        elif any(term in text for term in ["analytics", "metrics", "data", "dashboard"]):
-            return ContentCategory.ANALYTICS
-        elif any(term in text for term in ["growth", "viral", "acquisition"]):
-            return ContentCategory.GROWTH_HACKING
-        elif any(term in text for term in ["influencer", "creator", "ugc"]):
-            return ContentCategory.INFLUENCER
-        elif any(term in text for term in ["video", "youtube", "reels"]):
-            return ContentCategory.VIDEO_MARKETING
-        elif any(term in text for term in ["ai", "chatgpt", "automation", "gpt"]):
-            return ContentCategory.AI_MARKETING
-        elif any(term in text for term in ["ecommerce", "shopify", "store", "commerce"]):
-            return ContentCategory.ECOMMERCE
-        elif any(term in text for term in ["saas", "b2b", "enterprise"]):
-            return ContentCategory.B2B
-
-        return ContentCategory.STARTUP
+        return self._categorize_text(f"{name} {tagline} {' '.join(topics)}".lower())
+
+    # The same product shows up repeatedly within a run (search pages,
+    # multiple category listings), so memoize on the joined text
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _categorize_text(text: str) -> ContentCategory:
+        best = None
+        for match in ProductHuntScraper._CATEGORY_RE.finditer(text):
+            group = match.lastindex - 1
+            if group == 0:
+                return ProductHuntScraper._CATEGORY_TABLE[0]
+            if best is None or group < best:
+                best = group
+
+        return ProductHuntScraper._CATEGORY_TABLE[best] if best is not None else ContentCategory.STARTUP
+
+    MARKETING_KEYWORDS = (
+        "ai", "automation", "marketing", "seo", "analytics",
+        "social media", "email", "content", "sales", "leads",
+        "conversion", "growth", "engagement", "productivity",
+        "writing", "video", "design", "ecommerce", "startup",
+    )
+
+    _KEYWORD_RE, _KEYWORD_ORDER = compile_keyword_pattern(MARKETING_KEYWORDS)
 
     def _extract_keywords(self, name: str, tagline: str) -> list[str]:
         """Extract keywords from product info"""
-        text = f"{name} {tagline}".lower()
-
-        marketing_keywords = [
-            "ai", "automation", "marketing", "seo", "analytics",
-            "social media", "email", "content", "sales", "leads",
-            "conversion", "growth", "engagement", "productivity",
-            "writing", "video", "design", "ecommerce", "startup",
-        ]
-
-        found = []
-        for kw in marketing_keywords:
-            if kw in text:
-                found.append(kw)
-
-        return found[:10]
+        return extract_keywords(self._KEYWORD_RE, self._KEYWORD_ORDER, f"{name} {tagline}".lower())
 
     async def fetch_trending(self, limit: int = 25) -> list[Topic]:
         """Fetch today's top products from Product Hunt"""
@@ -98,52 +146,48 @@ class ProductHuntScraper(BaseScraper):
         try:
             # Fetch the homepage
             html = await self._fetch_html(self.base_url)
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find product cards (structure may change, this is a best effort)
-            # Look for common product list patterns
-            product_sections = soup.find_all(['div', 'article'], attrs={'data-test': True})
-
-            if not product_sections:
-                # Fallback: look for links that look like product pages
-                product_links = soup.find_all('a', href=lambda x: x and '/posts/' in x)
-
-                for idx, link in enumerate(product_links[:limit]):
-                    href = link.get('href', '')
-                    if not href.startswith('http'):
-                        href = f"{self.base_url}{href}"
-
-                    # Extract text content
-                    title = link.get_text(strip=True)
-                    if not title or len(title) < 3:
-                        continue
-
-                    topic = Topic(
-                        id=f"ph_{idx}",
-                        title=title[:200],
-                        description="Product Hunt launch",
-                        url=href,
-                        source=TrendSource.PRODUCT_HUNT,
-                        category=ContentCategory.STARTUP,
-                        published_at=datetime.now(timezone.utc),
-                        keywords=self._extract_keywords(title, ""),
-                    )
-
-                    topic.virality_score = 60 - (idx * 2)  # Higher rank = higher score
-                    topics.append(topic)
-
-        except Exception as e:
-            print(f"Error fetching Product Hunt: {e}")
-
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_topics = []
-        for topic in topics:
-            if topic.url not in seen_urls:
-                seen_urls.add(topic.url)
-                unique_topics.append(topic)
-
-        return unique_topics[:limit]
+
+            # Find product cards (structure may change, this is a best effort);
+            # fall back to links that look like product pages
+            if lxml_html is not None:
+                tree = lxml_html.document_fromstring(html)
+                product_sections = _DATA_TEST_SEL(tree)
+                product_links = [] if product_sections else [
+                    (a.get("href") or "", a.text_content().strip())
+                    for a in _POST_LINK_SEL(tree)
+                ]
+            else:
+                soup = BeautifulSoup(html, 'html.parser')
+                product_sections = soup.find_all(['div', 'article'], attrs={'data-test': True})
+                product_links = [] if product_sections else _soup_post_links(soup)
+
+            for idx, (href, title) in enumerate(product_links[:limit]):
+                if not href.startswith('http'):
+                    href = f"{self.base_url}{href}"
+
+                if not title or len(title) < 3:
+                    continue
+
+                topic = self._make_topic(
+                    id=f"ph_{idx}",
+                    title=title[:200],
+                    description="Product Hunt launch",
+                    url=href,
+                    source=TrendSource.PRODUCT_HUNT,
+                    category=ContentCategory.STARTUP,
+                    published_at=datetime.now(timezone.utc),
+                    keywords=self._extract_keywords(title, ""),
+                )
+
+                topic.virality_score = 60 - (idx * 2)  # Higher rank = higher score
+                topics.append(topic)
+
+        except Exception:
+            log.warning("fetch failed", exc_info=True)
+
+        # Deduplicate by URL in one C-level dict pass; insertion order is
+        # preserved, so ranking survives
+        return list({topic.url: topic for topic in topics}.values())[:limit]
 
     async def search(self, query: str, limit: int = 25) -> list[Topic]:
         """Search Product Hunt for products"""
@@ -154,21 +198,16 @@ class ProductHuntScraper(BaseScraper):
             params = {"q": query}
 
             html = await self._fetch_html(search_url, params)
-            soup = BeautifulSoup(html, 'html.parser')
 
             # Find search results
-            result_links = soup.find_all('a', href=lambda x: x and '/posts/' in x)
-
-            for idx, link in enumerate(result_links[:limit]):
-                href = link.get('href', '')
+            for idx, (href, title) in enumerate(_post_links(html)[:limit]):
                 if not href.startswith('http'):
                     href = f"{self.base_url}{href}"
 
-                title = link.get_text(strip=True)
                 if not title or len(title) < 3:
                     continue
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=f"ph_search_{idx}",
                     title=title[:200],
                     description=f"Search result for '{query}'",
@@ -181,8 +220,8 @@ class ProductHuntScraper(BaseScraper):
                 topic.virality_score = 50
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error searching Product Hunt: {e}")
+        except Exception:
+            log.warning("search failed query=%s", query, exc_info=True)
 
         return topics
 
@@ -193,20 +232,15 @@ class ProductHuntScraper(BaseScraper):
         try:
             category_url = f"{self.base_url}/topics/{category}"
             html = await self._fetch_html(category_url)
-            soup = BeautifulSoup(html, 'html.parser')
 
-            product_links = soup.find_all('a', href=lambda x: x and '/posts/' in x)
-
-            for idx, link in enumerate(product_links[:limit]):
-                href = link.get('href', '')
+            for idx, (href, title) in enumerate(_post_links(html)[:limit]):
                 if not href.startswith('http'):
                     href = f"{self.base_url}{href}"
 
-                title = link.get_text(strip=True)
                 if not title or len(title) < 3:
                     continue
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=f"ph_cat_{category}_{idx}",
                     title=title[:200],
                     description=f"Product in {category} category",
@@ -219,8 +253,8 @@ class ProductHuntScraper(BaseScraper):
                 topic.virality_score = 55 - (idx * 2)
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching PH category {category}: {e}")
+        except Exception:
+            log.warning("fetch failed category=%s", category, exc_info=True)
 
         return topics
 
@@ -228,15 +262,18 @@ class ProductHuntScraper(BaseScraper):
         """Fetch marketing-related tools from Product Hunt"""
         all_topics = []
 
-        # Fetch from multiple marketing-related categories
-        for category in self.MARKETING_CATEGORIES[:5]:  # Limit to avoid rate limiting
-            try:
-                category_topics = await self.fetch_category(category, limit=5)
+        # Fetch the marketing-related categories concurrently; the base-class
+        # token bucket and semaphore pace the requests, and a failed category
+        # drops out instead of aborting the batch
+        results = await asyncio.gather(
+            *(self.fetch_category(c, limit=5) for c in self.MARKETING_CATEGORIES[:5]),
+            return_exceptions=True,
+        )
+        for category_topics in results:
+            if isinstance(category_topics, list):
                 all_topics.extend(category_topics)
-            except Exception:
-                continue
-
-        # Sort by virality score
-        all_topics.sort(key=lambda x: x.virality_score, reverse=True)
 
-        return all_topics[:limit]
+        # The same product can appear under several categories; keep one
+        # entry per URL, then take the top-k
+        unique_topics = {topic.url: topic for topic in all_topics}.values()
+        return heapq.nlargest(limit, unique_topics, key=operator.attrgetter("virality_score"))
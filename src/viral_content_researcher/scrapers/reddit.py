@@ -3,12 +3,19 @@ Reddit scraper for marketing-related subreddits
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
-import re
+import asyncio
+import heapq
+import logging
+import operator
 
 from viral_content_researcher.scrapers.base import BaseScraper
+from viral_content_researcher.scrapers._keywords import compile_keyword_pattern, extract_keywords
 from viral_content_researcher.models import Topic, TrendSource, ContentCategory
 
+log = logging.getLogger(__name__)
+
 
 # Marketing-related subreddits to monitor
 MARKETING_SUBREDDITS = [
@@ -41,6 +48,9 @@ class RedditScraper(BaseScraper):
     source = TrendSource.REDDIT
     base_url = "https://www.reddit.com"
 
+    # Reddit accepts roughly 50 subreddits in one multireddit path segment
+    _MULTI_CHUNK = 50
+
     def __init__(self, subreddits: Optional[list[str]] = None, **kwargs):
         super().__init__(**kwargs)
         self.subreddits = subreddits or MARKETING_SUBREDDITS
@@ -49,108 +59,125 @@ class RedditScraper(BaseScraper):
         return {
             "User-Agent": "ViralContentResearcher/1.0 (Marketing Research Bot)",
             "Accept": "application/json",
+            # Reddit JSON compresses ~10x; aiohttp decompresses transparently
+            "Accept-Encoding": "gzip, deflate",
         }
 
-    def _categorize_subreddit(self, subreddit: str) -> ContentCategory:
+    _SUBREDDIT_CATEGORIES = {
+        "seo": ContentCategory.SEO,
+        "bigseo": ContentCategory.SEO,
+        "socialmedia": ContentCategory.SOCIAL_MEDIA,
+        "emailmarketing": ContentCategory.EMAIL_MARKETING,
+        "content_marketing": ContentCategory.CONTENT_MARKETING,
+        "copywriting": ContentCategory.CONTENT_MARKETING,
+        "ppc": ContentCategory.PAID_ADS,
+        "advertising": ContentCategory.PAID_ADS,
+        "analytics": ContentCategory.ANALYTICS,
+        "growthacking": ContentCategory.GROWTH_HACKING,
+        "entrepreneur": ContentCategory.STARTUP,
+        "startups": ContentCategory.STARTUP,
+        "saas": ContentCategory.B2B,
+        "ecommerce": ContentCategory.ECOMMERCE,
+        "shopify": ContentCategory.ECOMMERCE,
+        "dropship": ContentCategory.ECOMMERCE,
+    }
+
+    # The input space is ~20 subreddit names, so the lowercase-and-lookup
+    # runs once per name instead of once per post
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _categorize_subreddit(subreddit: str) -> ContentCategory:
         """Map subreddit to content category"""
-        mapping = {
-            "seo": ContentCategory.SEO,
-            "bigseo": ContentCategory.SEO,
-            "socialmedia": ContentCategory.SOCIAL_MEDIA,
-            "emailmarketing": ContentCategory.EMAIL_MARKETING,
-            "content_marketing": ContentCategory.CONTENT_MARKETING,
-            "copywriting": ContentCategory.CONTENT_MARKETING,
-            "ppc": ContentCategory.PAID_ADS,
-            "advertising": ContentCategory.PAID_ADS,
-            "analytics": ContentCategory.ANALYTICS,
-            "growthacking": ContentCategory.GROWTH_HACKING,
-            "entrepreneur": ContentCategory.STARTUP,
-            "startups": ContentCategory.STARTUP,
-            "saas": ContentCategory.B2B,
-            "ecommerce": ContentCategory.ECOMMERCE,
-            "shopify": ContentCategory.ECOMMERCE,
-            "dropship": ContentCategory.ECOMMERCE,
-        }
-        return mapping.get(subreddit.lower(), ContentCategory.GENERAL)
+        return RedditScraper._SUBREDDIT_CATEGORIES.get(
+            subreddit.lower(), ContentCategory.GENERAL
+        )
+
+    # Common marketing keywords to look for
+    MARKETING_KEYWORDS = (
+        "seo", "ppc", "roi", "ctr", "conversion", "funnel", "leads",
+        "traffic", "organic", "paid", "social media", "content",
+        "email", "automation", "analytics", "strategy", "campaign",
+        "brand", "influencer", "viral", "engagement", "audience",
+        "targeting", "retargeting", "cpc", "cpm", "impressions",
+        "reach", "awareness", "acquisition", "retention", "churn",
+        "saas", "b2b", "b2c", "ecommerce", "shopify", "amazon",
+        "facebook", "instagram", "tiktok", "linkedin", "twitter",
+        "google", "youtube", "pinterest", "reddit", "ai", "chatgpt",
+        "personalization", "segmentation", "a/b test",
+    )
+
+    _KEYWORD_RE, _KEYWORD_ORDER = compile_keyword_pattern(MARKETING_KEYWORDS)
 
     def _extract_keywords(self, title: str, selftext: str = "") -> list[str]:
         """Extract potential keywords from content"""
-        text = f"{title} {selftext}".lower()
-
-        # Common marketing keywords to look for
-        marketing_keywords = [
-            "seo", "ppc", "roi", "ctr", "conversion", "funnel", "leads",
-            "traffic", "organic", "paid", "social media", "content",
-            "email", "automation", "analytics", "strategy", "campaign",
-            "brand", "influencer", "viral", "engagement", "audience",
-            "targeting", "retargeting", "cpc", "cpm", "impressions",
-            "reach", "awareness", "acquisition", "retention", "churn",
-            "saas", "b2b", "b2c", "ecommerce", "shopify", "amazon",
-            "facebook", "instagram", "tiktok", "linkedin", "twitter",
-            "google", "youtube", "pinterest", "reddit", "ai", "chatgpt",
-            "automation", "personalization", "segmentation", "a/b test",
-        ]
-
-        found_keywords = []
-        for kw in marketing_keywords:
-            if kw in text:
-                found_keywords.append(kw)
-
-        return found_keywords[:10]  # Limit to top 10
+        return extract_keywords(self._KEYWORD_RE, self._KEYWORD_ORDER, f"{title} {selftext}".lower())
 
     async def fetch_trending(self, limit: int = 25) -> list[Topic]:
         """Fetch hot posts from marketing subreddits"""
         topics = []
 
-        for subreddit in self.subreddits:
-            try:
-                url = f"{self.base_url}/r/{subreddit}/hot.json"
-                params = {"limit": min(limit, 25)}
-
-                data = await self._fetch(url, params)
-
-                for post in data.get("data", {}).get("children", []):
-                    post_data = post.get("data", {})
-
-                    # Skip stickied/pinned posts
-                    if post_data.get("stickied"):
-                        continue
-
-                    # Skip very low engagement posts
-                    if post_data.get("score", 0) < 10:
-                        continue
-
-                    topic = Topic(
-                        id=post_data.get("id"),
-                        title=post_data.get("title", ""),
-                        description=post_data.get("selftext", "")[:500] if post_data.get("selftext") else None,
-                        url=f"https://reddit.com{post_data.get('permalink', '')}",
-                        source=TrendSource.REDDIT,
-                        category=self._categorize_subreddit(subreddit),
-                        score=post_data.get("score", 0),
-                        comments=post_data.get("num_comments", 0),
-                        author=post_data.get("author"),
-                        published_at=datetime.fromtimestamp(
-                            post_data.get("created_utc", 0),
-                            tz=timezone.utc
-                        ),
-                        keywords=self._extract_keywords(
-                            post_data.get("title", ""),
-                            post_data.get("selftext", "")
-                        ),
-                    )
-
-                    topic.virality_score = self.calculate_virality_score(topic)
-                    topics.append(topic)
-
-            except Exception as e:
-                # Log error but continue with other subreddits
-                print(f"Error fetching r/{subreddit}: {e}")
+        # One multireddit request (/r/a+b+c/hot.json) covers the whole sweep
+        # instead of one request and one JSON parse per subreddit, chunked to
+        # stay under Reddit's ~50-subreddit URL limit; a failed chunk drops
+        # out instead of aborting the sweep
+        chunks = [
+            self.subreddits[i:i + self._MULTI_CHUNK]
+            for i in range(0, len(self.subreddits), self._MULTI_CHUNK)
+        ]
+
+        async def _fetch_hot(subs: list[str]) -> dict:
+            url = f"{self.base_url}/r/{'+'.join(subs)}/hot.json"
+            return await self._fetch(url, {"limit": min(limit * len(subs), 100)})
+
+        results = await asyncio.gather(
+            *(_fetch_hot(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        for chunk, data in zip(chunks, results):
+            if isinstance(data, BaseException):
+                log.warning("fetch failed subreddits=%s", "+".join(chunk), exc_info=data)
                 continue
 
-        # Sort by virality score
-        topics.sort(key=lambda x: x.virality_score, reverse=True)
-        return topics[:limit]
+            for post in data.get("data", {}).get("children", []):
+                post_data = post.get("data") or {}
+
+                # Skip stickied/pinned posts
+                if post_data.get("stickied"):
+                    continue
+
+                # Skip very low engagement posts
+                score = post_data.get("score", 0)
+                if score < 10:
+                    continue
+
+                title = post_data.get("title", "")
+                selftext = post_data.get("selftext") or ""
+
+                topic = self._make_topic(
+                    id=post_data.get("id"),
+                    title=title,
+                    description=selftext[:500] if selftext else None,
+                    url=f"https://reddit.com{post_data.get('permalink', '')}",
+                    source=TrendSource.REDDIT,
+                    # Posts arrive interleaved, so the category comes from
+                    # each post's own subreddit (cached lookup)
+                    category=self._categorize_subreddit(post_data.get("subreddit", "")),
+                    score=score,
+                    comments=post_data.get("num_comments", 0),
+                    author=post_data.get("author"),
+                    published_at=datetime.fromtimestamp(
+                        post_data.get("created_utc", 0),
+                        tz=timezone.utc
+                    ),
+                    keywords=self._extract_keywords(title, selftext),
+                )
+
+                topic.virality_score = self.calculate_virality_score(topic)
+                topics.append(topic)
+
+        # Only limit topics are returned, so top-k beats a full sort
+        return heapq.nlargest(limit, topics, key=operator.attrgetter("virality_score"))
 
     async def search(self, query: str, limit: int = 25) -> list[Topic]:
         """Search Reddit for marketing topics"""
@@ -168,12 +195,14 @@ class RedditScraper(BaseScraper):
             data = await self._fetch(url, params)
 
             for post in data.get("data", {}).get("children", []):
-                post_data = post.get("data", {})
+                post_data = post.get("data") or {}
+                title = post_data.get("title", "")
+                selftext = post_data.get("selftext") or ""
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=post_data.get("id"),
-                    title=post_data.get("title", ""),
-                    description=post_data.get("selftext", "")[:500] if post_data.get("selftext") else None,
+                    title=title,
+                    description=selftext[:500] if selftext else None,
                     url=f"https://reddit.com{post_data.get('permalink', '')}",
                     source=TrendSource.REDDIT,
                     category=self._categorize_subreddit(post_data.get("subreddit", "")),
@@ -184,17 +213,14 @@ class RedditScraper(BaseScraper):
                         post_data.get("created_utc", 0),
                         tz=timezone.utc
                     ),
-                    keywords=self._extract_keywords(
-                        post_data.get("title", ""),
-                        post_data.get("selftext", "")
-                    ),
+                    keywords=self._extract_keywords(title, selftext),
                 )
 
                 topic.virality_score = self.calculate_virality_score(topic)
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error searching Reddit: {e}")
+        except Exception:
+            log.warning("search failed query=%s", query, exc_info=True)
 
         return topics
 
@@ -208,19 +234,24 @@ class RedditScraper(BaseScraper):
 
             data = await self._fetch(url, params)
 
+            category = self._categorize_subreddit(subreddit)
+
             for post in data.get("data", {}).get("children", []):
-                post_data = post.get("data", {})
+                post_data = post.get("data") or {}
 
                 if post_data.get("stickied"):
                     continue
 
-                topic = Topic(
+                title = post_data.get("title", "")
+                selftext = post_data.get("selftext") or ""
+
+                topic = self._make_topic(
                     id=post_data.get("id"),
-                    title=post_data.get("title", ""),
-                    description=post_data.get("selftext", "")[:500] if post_data.get("selftext") else None,
+                    title=title,
+                    description=selftext[:500] if selftext else None,
                     url=f"https://reddit.com{post_data.get('permalink', '')}",
                     source=TrendSource.REDDIT,
-                    category=self._categorize_subreddit(subreddit),
+                    category=category,
                     score=post_data.get("score", 0),
                     comments=post_data.get("num_comments", 0),
                     author=post_data.get("author"),
@@ -228,16 +259,13 @@ class RedditScraper(BaseScraper):
                         post_data.get("created_utc", 0),
                         tz=timezone.utc
                     ),
-                    keywords=self._extract_keywords(
-                        post_data.get("title", ""),
-                        post_data.get("selftext", "")
-                    ),
+                    keywords=self._extract_keywords(title, selftext),
                 )
 
                 topic.virality_score = self.calculate_virality_score(topic)
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching r/{subreddit}: {e}")
+        except Exception:
+            log.warning("fetch failed subreddit=%s", subreddit, exc_info=True)
 
         return topics
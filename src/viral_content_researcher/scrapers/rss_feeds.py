@@ -3,13 +3,39 @@ RSS Feed scraper for marketing blogs and news sources
 """
 
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from html import unescape
 import asyncio
+import calendar
+import logging
+import os
+import re
+import time
+
 import feedparser
 
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Shared bounded pool for feed parsing, so a 15-feed fan-out does not spill
+# onto the loop's default executor alongside other blocking work
+_PARSE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="feed-parse",
+)
+
 from viral_content_researcher.scrapers.base import BaseScraper
+from viral_content_researcher.scrapers._keywords import compile_keyword_pattern, extract_keywords
 from viral_content_researcher.models import Topic, TrendSource, ContentCategory
 
+log = logging.getLogger(__name__)
+
 
 # Default marketing RSS feeds to monitor
 DEFAULT_MARKETING_FEEDS = [
@@ -44,6 +70,14 @@ class RSSFeedScraper(BaseScraper):
     source = TrendSource.RSS_FEED
     base_url = ""
 
+    # Recency ladder for virality: (age threshold in hours, score)
+    _RECENCY_SCORES = ((6, 70), (24, 60), (48, 50), (72, 40))
+
+    # A full refetch hits every configured feed; the merged result barely
+    # changes within minutes, so memoize it briefly — the same shape as the
+    # related-topics cache in the Google Trends scraper
+    _TRENDING_TTL = 300.0
+
     def __init__(
         self,
         feeds: Optional[list[tuple[str, str, ContentCategory]]] = None,
@@ -51,17 +85,20 @@ class RSSFeedScraper(BaseScraper):
     ):
         super().__init__(**kwargs)
         self.feeds = feeds or DEFAULT_MARKETING_FEEDS
+        self._trending_cache: Optional[tuple[float, list[Topic]]] = None
+
+    _DATE_FIELDS = ('published_parsed', 'updated_parsed', 'created_parsed')
 
     def _parse_date(self, entry: dict) -> Optional[datetime]:
         """Parse date from feed entry"""
-        date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
-
-        for field in date_fields:
+        for field in self._DATE_FIELDS:
             if entry.get(field):
                 try:
-                    import time
+                    # feedparser's *_parsed structs are UTC; timegm reads
+                    # them as such, where mktime would apply the local zone
+                    # and a DST correction just for fromtimestamp to undo
                     return datetime.fromtimestamp(
-                        time.mktime(entry[field]),
+                        calendar.timegm(entry[field]),
                         tz=timezone.utc
                     )
                 except (ValueError, TypeError):
@@ -69,31 +106,40 @@ class RSSFeedScraper(BaseScraper):
 
         return None
 
-    def _extract_keywords(self, title: str, summary: str = "") -> list[str]:
-        """Extract keywords from content"""
-        text = f"{title} {summary}".lower()
-
-        marketing_keywords = [
-            "seo", "marketing", "content", "social media", "email",
-            "conversion", "traffic", "leads", "sales", "roi",
-            "analytics", "strategy", "campaign", "brand", "growth",
-            "ai", "automation", "personalization", "engagement",
-            "advertising", "ppc", "influencer", "video", "podcast",
-            "newsletter", "ecommerce", "shopify", "startup", "saas",
-        ]
+    MARKETING_KEYWORDS = (
+        "seo", "marketing", "content", "social media", "email",
+        "conversion", "traffic", "leads", "sales", "roi",
+        "analytics", "strategy", "campaign", "brand", "growth",
+        "ai", "automation", "personalization", "engagement",
+        "advertising", "ppc", "influencer", "video", "podcast",
+        "newsletter", "ecommerce", "shopify", "startup", "saas",
+    )
 
-        found = []
-        for kw in marketing_keywords:
-            if kw in text:
-                found.append(kw)
+    _KEYWORD_RE, _KEYWORD_ORDER = compile_keyword_pattern(MARKETING_KEYWORDS)
 
-        return found[:10]
+    def _extract_keywords(self, title: str, summary: str = "") -> list[str]:
+        """Extract keywords from content"""
+        return extract_keywords(self._KEYWORD_RE, self._KEYWORD_ORDER, f"{title} {summary}".lower())
 
     def _clean_html(self, html: str) -> str:
         """Remove HTML tags from text"""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
-        return soup.get_text(separator=' ', strip=True)[:500]
+        if not html:
+            return ""
+
+        # Scripts and CDATA/comment blocks need a real parser to drop their
+        # contents; everything else gets a linear regex strip, which skips
+        # tree construction entirely for the typical short feed summary
+        if "<script" in html.lower() or "<!" in html:
+            if lxml_html is not None:
+                tree = lxml_html.document_fromstring(html)
+                for node in tree.iter("script", "style"):
+                    node.drop_tree()
+                return " ".join(tree.text_content().split())[:500]
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html, 'html.parser')
+            return soup.get_text(separator=' ', strip=True)[:500]
+
+        return _WS_RE.sub(" ", unescape(_TAG_RE.sub(" ", html))).strip()[:500]
 
     async def _fetch_feed(
         self,
@@ -106,16 +152,21 @@ class RSSFeedScraper(BaseScraper):
         topics = []
 
         try:
-            # feedparser is synchronous, so we run it in executor
+            # Download over the shared keep-alive session (with the base
+            # class's rate limiting and retries), then hand only the parse
+            # work to the bounded executor
+            body = await self._fetch_html(feed_url)
             loop = asyncio.get_event_loop()
-            feed = await loop.run_in_executor(None, feedparser.parse, feed_url)
+            feed = await loop.run_in_executor(_PARSE_EXECUTOR, feedparser.parse, body)
+
+            now = datetime.now(timezone.utc)
 
             for entry in feed.entries[:limit]:
                 title = entry.get('title', '')
                 link = entry.get('link', '')
                 summary = self._clean_html(entry.get('summary', entry.get('description', '')))
 
-                topic = Topic(
+                topic = self._make_topic(
                     id=entry.get('id', link),
                     title=title,
                     description=summary,
@@ -129,15 +180,11 @@ class RSSFeedScraper(BaseScraper):
 
                 # RSS feeds don't have engagement metrics, estimate virality by recency
                 if topic.published_at:
-                    hours_old = (datetime.now(timezone.utc) - topic.published_at).total_seconds() / 3600
-                    if hours_old < 6:
-                        topic.virality_score = 70
-                    elif hours_old < 24:
-                        topic.virality_score = 60
-                    elif hours_old < 48:
-                        topic.virality_score = 50
-                    elif hours_old < 72:
-                        topic.virality_score = 40
+                    hours_old = (now - topic.published_at).total_seconds() / 3600
+                    for threshold, score in self._RECENCY_SCORES:
+                        if hours_old < threshold:
+                            topic.virality_score = score
+                            break
                     else:
                         topic.virality_score = 30
                 else:
@@ -145,13 +192,19 @@ class RSSFeedScraper(BaseScraper):
 
                 topics.append(topic)
 
-        except Exception as e:
-            print(f"Error fetching feed {feed_name}: {e}")
+        except Exception:
+            log.warning("fetch failed feed=%s", feed_name, exc_info=True)
 
         return topics
 
     async def fetch_trending(self, limit: int = 25) -> list[Topic]:
         """Fetch latest posts from all configured RSS feeds"""
+        # The per-feed entry cap is fixed, so the merged list is independent
+        # of limit and one cached fetch serves any slice of it
+        cached = self._trending_cache
+        if cached is not None and time.monotonic() - cached[0] < self._TRENDING_TTL:
+            return cached[1][:limit]
+
         all_topics = []
 
         # Fetch all feeds in parallel
@@ -172,6 +225,7 @@ class RSSFeedScraper(BaseScraper):
             reverse=True
         )
 
+        self._trending_cache = (time.monotonic(), all_topics)
         return all_topics[:limit]
 
     async def search(self, query: str, limit: int = 25) -> list[Topic]:
@@ -223,10 +277,12 @@ class RSSFeedScraper(BaseScraper):
     def add_feed(self, url: str, name: str, category: ContentCategory):
         """Add a new feed to monitor"""
         self.feeds.append((url, name, category))
+        self._trending_cache = None
 
     def remove_feed(self, url: str):
         """Remove a feed from monitoring"""
         self.feeds = [(u, n, c) for u, n, c in self.feeds if u != url]
+        self._trending_cache = None
 
     def list_feeds(self) -> list[tuple[str, str, ContentCategory]]:
         """List all configured feeds"""
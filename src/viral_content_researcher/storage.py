@@ -2,9 +2,12 @@
 SQLite storage layer for persisting research data
 """
 
-import json
 import aiosqlite
-from datetime import datetime, timezone
+import asyncio
+import orjson
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import uuid
@@ -17,18 +20,143 @@ from viral_content_researcher.models import (
     ResearchSession,
 )
 
+try:
+    # C parser, roughly an order of magnitude faster than the stdlib on
+    # arbitrary ISO-8601 input
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    # Every stored timestamp is isoformat() output, which keeps the
+    # C-accelerated fromisoformat on its fast path; binding it at module
+    # scope also skips the attribute lookup per row
+    _parse_iso = datetime.fromisoformat
+
+# Enum conversion tables: Enum.__call__ and the .value descriptor both cost
+# far more than a dict hit, and row conversion pays them per row
+_TREND_SOURCE_BY_VALUE = {member.value: member for member in TrendSource}
+_CATEGORY_BY_VALUE = {member.value: member for member in ContentCategory}
+_TREND_SOURCE_VALUE = {member: member.value for member in TrendSource}
+_CATEGORY_VALUE = {member: member.value for member in ContentCategory}
+
+# Fixed column order shared by every topic SELECT and _row_to_topic's
+# positional unpack; SELECT * would break the pairing as columns migrate in
+_TOPIC_COLUMNS = (
+    "id, title, description, url, source, category, score, comments, "
+    "shares, views, virality_score, trending_velocity, keywords, hashtags, "
+    "author, published_at, discovered_at, content_angle, target_audience"
+)
+
+# The FTS join needs qualified names: topics_fts shadows title/description/
+# keywords and unqualified references would be ambiguous
+_TOPIC_COLUMNS_QUALIFIED = ", ".join(
+    "topics." + column for column in _TOPIC_COLUMNS.split(", ")
+)
+
+_SQL_INSERT_TOPIC = """
+    INSERT OR REPLACE INTO topics
+    (id, title, description, url, source, category, score, comments,
+     shares, views, virality_score, trending_velocity, keywords,
+     hashtags, author, published_at, discovered_at, content_angle,
+     target_audience, saved)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SEARCH_TOPICS = f"""
+    SELECT {_TOPIC_COLUMNS_QUALIFIED} FROM topics
+    JOIN topics_fts ON topics.rowid = topics_fts.rowid
+    WHERE topics_fts MATCH ?
+    ORDER BY bm25(topics_fts)
+    LIMIT ?
+"""
+
+_SQL_GET_TOPIC = f"SELECT {_TOPIC_COLUMNS} FROM topics WHERE id = ?"
+
+_SQL_UPDATE_SAVED = "UPDATE topics SET saved = ? WHERE id = ?"
+
+_SQL_INSERT_BRIEF = """
+    INSERT OR REPLACE INTO content_briefs
+    (id, title, hook, outline, source_topic_ids, suggested_format,
+     estimated_word_count, target_keywords, meta_description,
+     suggested_title_variants, category, urgency, notes, competitors)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_BRIEF_TOPIC = """
+    INSERT OR REPLACE INTO brief_topics (brief_id, topic_id, ord)
+    VALUES (?, ?, ?)
+"""
+
+_SQL_BRIEFS_FOR_TOPIC = """
+    SELECT content_briefs.* FROM content_briefs
+    JOIN brief_topics ON content_briefs.id = brief_topics.brief_id
+    WHERE brief_topics.topic_id = ?
+    ORDER BY content_briefs.created_at DESC
+"""
+
+# Rows per executemany transaction; bounds per-batch memory and keeps any
+# single write transaction (and its WAL growth) from ballooning on big imports
+_INSERT_BATCH = 500
+
+# Point-lookup cache bound; FIFO eviction past this many topics
+_TOPIC_CACHE_SIZE = 1024
+
+# Read-only connections opened alongside the writer. Each aiosqlite
+# connection runs on its own worker thread, so under WAL this many reads
+# can proceed in parallel instead of queueing behind one thread.
+_READ_POOL_SIZE = 4
+
+
+@lru_cache(maxsize=None)
+def _topics_query(has_source: bool, has_category: bool, saved_only: bool) -> str:
+    """Compose the get_topics SQL for one filter shape.
+
+    There are only eight shapes, so memoizing keeps each string identical
+    across calls and SQLite's per-connection statement cache hits instead
+    of re-preparing.
+    """
+    query = f"SELECT {_TOPIC_COLUMNS} FROM topics WHERE virality_score >= ?"
+    if has_source:
+        query += " AND source = ?"
+    if has_category:
+        query += " AND category = ?"
+    if saved_only:
+        query += " AND saved = 1"
+    return query + " ORDER BY virality_score DESC LIMIT ? OFFSET ?"
+
+
+@lru_cache(maxsize=None)
+def _briefs_query(has_category: bool) -> str:
+    """Compose the get_briefs SQL for one filter shape"""
+    query = "SELECT * FROM content_briefs"
+    if has_category:
+        query += " WHERE category = ?"
+    return query + " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Each token is quoted (with embedded quotes doubled) so user input like
+    'seo -tips' or stray parens can't be parsed as FTS operators; the
+    tokens combine with FTS5's implicit AND.
+    """
+    return " ".join(
+        '"' + token.replace('"', '""') + '"' for token in query.split()
+    )
+
 
 class Storage:
     """
     Async SQLite storage for topics, briefs, and research sessions.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, cache_topics: bool = True):
         """
         Initialize storage.
 
         Args:
             db_path: Path to SQLite database (defaults to ~/.vcr/data.db)
+            cache_topics: Cache get_topic results in memory (disable for
+                tests that need every lookup to hit the database)
         """
         if db_path:
             self.db_path = Path(db_path)
@@ -37,19 +165,82 @@ class Storage:
 
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection: Optional[aiosqlite.Connection] = None
+        self._read_pool: Optional[asyncio.Queue] = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._cache_topics = cache_topics
+        # Point-lookup cache; any mutation flushes it wholesale, which is
+        # simple and always correct
+        self._topic_cache: dict[str, Topic] = {}
 
     async def connect(self):
         """Connect to the database and initialize tables"""
         self._connection = await aiosqlite.connect(str(self.db_path))
         self._connection.row_factory = aiosqlite.Row
+        # WAL lets reads proceed while a write commits, and NORMAL sync under
+        # WAL drops to one fsync per commit; the rest sizes the page cache and
+        # keeps temp structures off disk. All are idempotent on reconnect.
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-64000",
+            "PRAGMA mmap_size=268435456",
+            "PRAGMA busy_timeout=5000",
+            # INSERT OR REPLACE must fire the DELETE triggers that keep the
+            # FTS index in sync with replaced rows
+            "PRAGMA recursive_triggers=ON",
+        ):
+            await self._connection.execute(pragma)
         await self._init_tables()
 
+        # WAL allows many readers alongside the single writer, but one
+        # aiosqlite connection still serializes everything through its one
+        # worker thread. Read-only connections give the get_*/search_* paths
+        # their own threads; journal_mode is a property of the database file,
+        # so the readers only need the per-connection tuning PRAGMAs.
+        self._read_pool = asyncio.Queue()
+        self._readers = []
+        for _ in range(_READ_POOL_SIZE):
+            reader = await aiosqlite.connect(
+                f"file:{self.db_path}?mode=ro", uri=True
+            )
+            reader.row_factory = aiosqlite.Row
+            for pragma in (
+                "PRAGMA temp_store=MEMORY",
+                "PRAGMA cache_size=-16000",
+                "PRAGMA mmap_size=268435456",
+                "PRAGMA busy_timeout=5000",
+            ):
+                await reader.execute(pragma)
+            self._readers.append(reader)
+            self._read_pool.put_nowait(reader)
+
+        # Refresh planner statistics so index choices (notably the composite
+        # vs. plain virality index) rest on measured selectivity rather than
+        # default heuristics. analysis_limit bounds the scan, so this stays
+        # cheap even on large tables.
+        await self._connection.execute("PRAGMA analysis_limit=1000")
+        await self._connection.execute("PRAGMA optimize")
+
     async def close(self):
-        """Close the database connection"""
+        """Close the database connections"""
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._read_pool = None
         if self._connection:
             await self._connection.close()
             self._connection = None
 
+    @asynccontextmanager
+    async def _read(self):
+        """Borrow a read-only connection from the pool"""
+        connection = await self._read_pool.get()
+        try:
+            yield connection
+        finally:
+            self._read_pool.put_nowait(connection)
+
     async def _init_tables(self):
         """Initialize database tables"""
         await self._connection.executescript("""
@@ -107,102 +298,216 @@ class Storage:
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP
             );
 
-            CREATE INDEX IF NOT EXISTS idx_topics_source ON topics(source);
-            CREATE INDEX IF NOT EXISTS idx_topics_category ON topics(category);
+            -- Superseded by idx_topics_cat_src_vir; single low-cardinality
+            -- columns made poor indexes but still taxed every write
+            DROP INDEX IF EXISTS idx_topics_source;
+            DROP INDEX IF EXISTS idx_topics_category;
+
+            -- Covers get_topics' filters and ORDER BY so filtered listings
+            -- run as index-only scans; idx_topics_virality stays for the
+            -- unfiltered case
+            CREATE INDEX IF NOT EXISTS idx_topics_cat_src_vir
+                ON topics(category, source, virality_score DESC, saved);
             CREATE INDEX IF NOT EXISTS idx_topics_virality ON topics(virality_score DESC);
             CREATE INDEX IF NOT EXISTS idx_topics_discovered ON topics(discovered_at DESC);
-            CREATE INDEX IF NOT EXISTS idx_topics_saved ON topics(saved);
+
+            -- Partial indexes: saved topics are the rare case, so indexing
+            -- the full boolean column scanned half the table anyway. These
+            -- cover only the rows each query touches, and inserts of
+            -- ordinary unsaved rows skip the saved=1 index entirely
+            DROP INDEX IF EXISTS idx_topics_saved;
+            CREATE INDEX IF NOT EXISTS idx_topics_saved_virality
+                ON topics(virality_score DESC) WHERE saved = 1;
+            CREATE INDEX IF NOT EXISTS idx_topics_unsaved_discovered
+                ON topics(discovered_at) WHERE saved = 0;
+            -- Junction rows alongside the serialized source_topic_ids
+            -- column, so "briefs citing topic X" is a join instead of a
+            -- scan over JSON blobs
+            CREATE TABLE IF NOT EXISTS brief_topics (
+                brief_id TEXT NOT NULL,
+                topic_id TEXT NOT NULL,
+                ord INTEGER NOT NULL,
+                PRIMARY KEY (brief_id, topic_id)
+            );
+
             CREATE INDEX IF NOT EXISTS idx_briefs_category ON content_briefs(category);
             CREATE INDEX IF NOT EXISTS idx_briefs_created ON content_briefs(created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_brief_topics_topic ON brief_topics(topic_id);
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS topics_fts USING fts5(
+                title, description, keywords,
+                content='topics', content_rowid='rowid',
+                tokenize='unicode61'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS topics_fts_insert AFTER INSERT ON topics BEGIN
+                INSERT INTO topics_fts(rowid, title, description, keywords)
+                VALUES (new.rowid, new.title, new.description, new.keywords);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topics_fts_delete AFTER DELETE ON topics BEGIN
+                INSERT INTO topics_fts(topics_fts, rowid, title, description, keywords)
+                VALUES ('delete', old.rowid, old.title, old.description, old.keywords);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS topics_fts_update AFTER UPDATE ON topics BEGIN
+                INSERT INTO topics_fts(topics_fts, rowid, title, description, keywords)
+                VALUES ('delete', old.rowid, old.title, old.description, old.keywords);
+                INSERT INTO topics_fts(rowid, title, description, keywords)
+                VALUES (new.rowid, new.title, new.description, new.keywords);
+            END;
         """)
+
+        # One-time migrations gated by user_version so reconnects skip them.
+        async with self._connection.execute("PRAGMA user_version") as cursor:
+            version = (await cursor.fetchone())[0]
+
+        if version < 1:
+            # Backfill the FTS index for databases created before it existed
+            await self._connection.execute(
+                "INSERT INTO topics_fts(topics_fts) VALUES ('rebuild')"
+            )
+
+        if version < 2:
+            # Generated columns surfacing the primary keyword/hashtag out of
+            # the JSON arrays, with indexes so tag lookups are btree seeks
+            # instead of JSON string scans. ALTER TABLE only allows VIRTUAL
+            # generated columns; the indexes store the computed values, so
+            # seeks never re-evaluate json_extract per row.
+            await self._connection.execute(
+                "ALTER TABLE topics ADD COLUMN first_keyword TEXT"
+                " AS (json_extract(keywords, '$[0]'))"
+            )
+            await self._connection.execute(
+                "ALTER TABLE topics ADD COLUMN first_hashtag TEXT"
+                " AS (json_extract(hashtags, '$[0]'))"
+            )
+            await self._connection.execute(
+                "CREATE INDEX idx_topics_first_keyword ON topics(first_keyword)"
+            )
+            await self._connection.execute(
+                "CREATE INDEX idx_topics_first_hashtag ON topics(first_hashtag)"
+            )
+            await self._connection.execute("PRAGMA user_version=2")
         await self._connection.commit()
 
-    def _topic_to_row(self, topic: Topic) -> dict:
-        """Convert Topic to database row"""
-        return {
-            "id": topic.id or str(uuid.uuid4()),
-            "title": topic.title,
-            "description": topic.description,
-            "url": topic.url,
-            "source": topic.source.value,
-            "category": topic.category.value,
-            "score": topic.score,
-            "comments": topic.comments,
-            "shares": topic.shares,
-            "views": topic.views,
-            "virality_score": topic.virality_score,
-            "trending_velocity": topic.trending_velocity,
-            "keywords": json.dumps(topic.keywords),
-            "hashtags": json.dumps(topic.hashtags),
-            "author": topic.author,
-            "published_at": topic.published_at.isoformat() if topic.published_at else None,
-            "discovered_at": topic.discovered_at.isoformat(),
-            "content_angle": topic.content_angle,
-            "target_audience": topic.target_audience,
-        }
+    def _topic_to_row(self, topic: Topic, saved: int = 0) -> tuple:
+        """Convert Topic to a _SQL_INSERT_TOPIC parameter tuple.
+
+        Builds the tuple directly, like _brief_to_row; the old dict
+        intermediate cost an allocation and twenty key lookups per row on
+        the bulk-insert path.
+        """
+        return (
+            topic.id or str(uuid.uuid4()), topic.title, topic.description,
+            topic.url, _TREND_SOURCE_VALUE[topic.source],
+            _CATEGORY_VALUE[topic.category],
+            topic.score, topic.comments, topic.shares, topic.views,
+            topic.virality_score, topic.trending_velocity,
+            orjson.dumps(topic.keywords).decode(),
+            orjson.dumps(topic.hashtags).decode(), topic.author,
+            topic.published_at.isoformat() if topic.published_at else None,
+            topic.discovered_at.isoformat(), topic.content_angle,
+            topic.target_audience, saved,
+        )
 
     def _row_to_topic(self, row: aiosqlite.Row) -> Topic:
-        """Convert database row to Topic"""
+        """Convert a _TOPIC_COLUMNS-ordered row to a Topic.
+
+        Unpacks positionally: Row's named access scans the column list on
+        every lookup, which adds up over nineteen fields per row on large
+        result sets.
+        """
+        (topic_id, title, description, url, source, category, score,
+         comments, shares, views, virality_score, trending_velocity,
+         keywords, hashtags, author, published_at, discovered_at,
+         content_angle, target_audience) = row
         return Topic(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            url=row["url"],
-            source=TrendSource(row["source"]),
-            category=ContentCategory(row["category"]),
-            score=row["score"],
-            comments=row["comments"],
-            shares=row["shares"],
-            views=row["views"],
-            virality_score=row["virality_score"],
-            trending_velocity=row["trending_velocity"],
-            keywords=json.loads(row["keywords"]) if row["keywords"] else [],
-            hashtags=json.loads(row["hashtags"]) if row["hashtags"] else [],
-            author=row["author"],
-            published_at=datetime.fromisoformat(row["published_at"]) if row["published_at"] else None,
-            discovered_at=datetime.fromisoformat(row["discovered_at"]),
-            content_angle=row["content_angle"],
-            target_audience=row["target_audience"],
+            id=topic_id,
+            title=title,
+            description=description,
+            url=url,
+            source=_TREND_SOURCE_BY_VALUE[source],
+            category=_CATEGORY_BY_VALUE[category],
+            score=score,
+            comments=comments,
+            shares=shares,
+            views=views,
+            virality_score=virality_score,
+            trending_velocity=trending_velocity,
+            keywords=orjson.loads(keywords) if keywords else [],
+            hashtags=orjson.loads(hashtags) if hashtags else [],
+            author=author,
+            published_at=_parse_iso(published_at) if published_at else None,
+            discovered_at=_parse_iso(discovered_at),
+            content_angle=content_angle,
+            target_audience=target_audience,
         )
 
+    @asynccontextmanager
+    async def transaction(self):
+        """Group writes into one transaction with a single commit.
+
+        save_topic and save_brief no longer commit themselves, so callers
+        doing standalone writes wrap them here; batching many writes under
+        one transaction() pays one fsync for the lot.
+        """
+        await self._connection.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            await self._connection.rollback()
+            raise
+        else:
+            await self._connection.commit()
+
     async def save_topic(self, topic: Topic, saved: bool = False) -> str:
-        """Save a topic to the database"""
-        row = self._topic_to_row(topic)
-        row["saved"] = 1 if saved else 0
-
-        await self._connection.execute("""
-            INSERT OR REPLACE INTO topics
-            (id, title, description, url, source, category, score, comments,
-             shares, views, virality_score, trending_velocity, keywords,
-             hashtags, author, published_at, discovered_at, content_angle,
-             target_audience, saved)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            row["id"], row["title"], row["description"], row["url"],
-            row["source"], row["category"], row["score"], row["comments"],
-            row["shares"], row["views"], row["virality_score"],
-            row["trending_velocity"], row["keywords"], row["hashtags"],
-            row["author"], row["published_at"], row["discovered_at"],
-            row["content_angle"], row["target_audience"], row["saved"],
-        ))
-        await self._connection.commit()
-        return row["id"]
+        """Save a topic; the caller's transaction() controls the commit"""
+        self._topic_cache.clear()
+        row = self._topic_to_row(topic, saved=1 if saved else 0)
+        await self._connection.execute(_SQL_INSERT_TOPIC, row)
+        return row[0]
+
+    async def save_topic_autocommit(self, topic: Topic, saved: bool = False) -> str:
+        """Save and commit a single topic, for one-off writes"""
+        async with self.transaction():
+            return await self.save_topic(topic, saved=saved)
 
     async def save_topics(self, topics: list[Topic]) -> int:
-        """Save multiple topics to the database"""
-        count = 0
-        for topic in topics:
-            await self.save_topic(topic)
-            count += 1
-        return count
+        """Save multiple topics in batched transactions.
+
+        One executemany per batch instead of one commit per row, so a bulk
+        import pays a handful of fsyncs rather than one per topic.
+        """
+        self._topic_cache.clear()
+        params = [self._topic_to_row(topic) for topic in topics]
+
+        for start in range(0, len(params), _INSERT_BATCH):
+            await self._connection.execute("BEGIN")
+            await self._connection.executemany(
+                _SQL_INSERT_TOPIC, params[start:start + _INSERT_BATCH]
+            )
+            await self._connection.commit()
+        return len(params)
 
     async def get_topic(self, topic_id: str) -> Optional[Topic]:
         """Get a topic by ID"""
-        async with self._connection.execute(
-            "SELECT * FROM topics WHERE id = ?", (topic_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return self._row_to_topic(row) if row else None
+        cached = self._topic_cache.get(topic_id)
+        if cached is not None:
+            return cached
+
+        async with self._read() as conn:
+            async with conn.execute(_SQL_GET_TOPIC, (topic_id,)) as cursor:
+                row = await cursor.fetchone()
+
+        if row is None:
+            return None
+        topic = self._row_to_topic(row)
+        if self._cache_topics:
+            if len(self._topic_cache) >= _TOPIC_CACHE_SIZE:
+                self._topic_cache.pop(next(iter(self._topic_cache)))
+            self._topic_cache[topic_id] = topic
+        return topic
 
     async def get_topics(
         self,
@@ -214,70 +519,160 @@ class Storage:
         saved_only: bool = False,
     ) -> list[Topic]:
         """Get topics with optional filters"""
-        query = "SELECT * FROM topics WHERE virality_score >= ?"
+        query = _topics_query(source is not None, category is not None, saved_only)
         params = [min_score]
 
         if source:
-            query += " AND source = ?"
             params.append(source.value)
 
         if category:
-            query += " AND category = ?"
             params.append(category.value)
 
-        if saved_only:
-            query += " AND saved = 1"
+        params.extend([limit, offset])
+
+        # Iterate the cursor instead of fetchall(): rows convert as they
+        # arrive, without materializing a second full list of Row objects
+        async with self._read() as conn:
+            async with conn.execute(query, params) as cursor:
+                return [self._row_to_topic(row) async for row in cursor]
+
+    async def iter_topics(
+        self,
+        limit: int = 25,
+        offset: int = 0,
+        source: Optional[TrendSource] = None,
+        category: Optional[ContentCategory] = None,
+        min_score: float = 0,
+        saved_only: bool = False,
+    ):
+        """Stream topics one at a time, for callers that don't need a list"""
+        query = _topics_query(source is not None, category is not None, saved_only)
+        params = [min_score]
+
+        if source:
+            params.append(source.value)
+
+        if category:
+            params.append(category.value)
 
-        query += " ORDER BY virality_score DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with self._connection.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [self._row_to_topic(row) for row in rows]
+        async with self._read() as conn:
+            async with conn.execute(query, params) as cursor:
+                async for row in cursor:
+                    yield self._row_to_topic(row)
 
     async def search_topics(self, query: str, limit: int = 25) -> list[Topic]:
-        """Search topics by title or description"""
-        search_query = f"%{query}%"
-        async with self._connection.execute("""
-            SELECT * FROM topics
-            WHERE title LIKE ? OR description LIKE ? OR keywords LIKE ?
-            ORDER BY virality_score DESC
-            LIMIT ?
-        """, (search_query, search_query, search_query, limit)) as cursor:
-            rows = await cursor.fetchall()
-            return [self._row_to_topic(row) for row in rows]
+        """Full-text search over title, description, and keywords.
+
+        Runs against the topics_fts inverted index and ranks by bm25
+        relevance instead of LIKE-scanning the whole table.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        async with self._read() as conn:
+            async with conn.execute(_SQL_SEARCH_TOPICS, (match, limit)) as cursor:
+                return [self._row_to_topic(row) async for row in cursor]
+
+    async def get_topics_by_keyword(self, keyword: str, limit: int = 25) -> list[Topic]:
+        """Get topics tagged with a keyword.
+
+        An index seek on the generated first_keyword column handles the
+        common case; when the keyword is not the primary tag, full-text
+        search picks up matches deeper in the keyword list.
+        """
+        async with self._read() as conn:
+            async with conn.execute(f"""
+                SELECT {_TOPIC_COLUMNS} FROM topics WHERE first_keyword = ?
+                ORDER BY virality_score DESC LIMIT ?
+            """, (keyword, limit)) as cursor:
+                topics = [self._row_to_topic(row) async for row in cursor]
+
+        if topics:
+            return topics
+        return await self.search_topics(keyword, limit)
 
     async def mark_saved(self, topic_id: str, saved: bool = True) -> bool:
         """Mark a topic as saved/unsaved"""
+        self._topic_cache.clear()
         result = await self._connection.execute(
-            "UPDATE topics SET saved = ? WHERE id = ?",
-            (1 if saved else 0, topic_id)
+            _SQL_UPDATE_SAVED, (1 if saved else 0, topic_id)
         )
         await self._connection.commit()
         return result.rowcount > 0
 
-    async def save_brief(self, brief: ContentBrief) -> str:
-        """Save a content brief to the database"""
-        brief_id = brief.id or str(uuid.uuid4())
-
-        await self._connection.execute("""
-            INSERT OR REPLACE INTO content_briefs
-            (id, title, hook, outline, source_topic_ids, suggested_format,
-             estimated_word_count, target_keywords, meta_description,
-             suggested_title_variants, category, urgency, notes, competitors)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            brief_id, brief.title, brief.hook,
-            json.dumps(brief.outline),
-            json.dumps([t.id for t in brief.source_topics]),
+    async def mark_saved_bulk(self, topic_ids: list[str], saved: bool = True) -> int:
+        """Mark many topics saved/unsaved under a single commit.
+
+        One UPDATE ... IN per chunk instead of a commit per id; chunks of
+        _INSERT_BATCH keep the bound-parameter count under SQLite's limit.
+        """
+        if not topic_ids:
+            return 0
+
+        self._topic_cache.clear()
+        flag = 1 if saved else 0
+        updated = 0
+        for start in range(0, len(topic_ids), _INSERT_BATCH):
+            chunk = topic_ids[start:start + _INSERT_BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            result = await self._connection.execute(
+                f"UPDATE topics SET saved = ? WHERE id IN ({placeholders})",
+                [flag, *chunk],
+            )
+            updated += result.rowcount
+        await self._connection.commit()
+        return updated
+
+    def _brief_to_row(self, brief: ContentBrief) -> tuple:
+        """Convert ContentBrief to a database row tuple"""
+        return (
+            brief.id or str(uuid.uuid4()), brief.title, brief.hook,
+            orjson.dumps(brief.outline).decode(),
+            orjson.dumps([t.id for t in brief.source_topics]).decode(),
             brief.suggested_format, brief.estimated_word_count,
-            json.dumps(brief.target_keywords), brief.meta_description,
-            json.dumps(brief.suggested_title_variants),
-            brief.category.value, brief.urgency, brief.notes,
-            json.dumps(brief.competitors),
-        ))
+            orjson.dumps(brief.target_keywords).decode(), brief.meta_description,
+            orjson.dumps(brief.suggested_title_variants).decode(),
+            _CATEGORY_VALUE[brief.category], brief.urgency, brief.notes,
+            orjson.dumps(brief.competitors).decode(),
+        )
+
+    async def save_brief(self, brief: ContentBrief) -> str:
+        """Save a content brief; the caller's transaction() controls the commit"""
+        row = self._brief_to_row(brief)
+        await self._connection.execute(_SQL_INSERT_BRIEF, row)
+        await self._connection.execute(
+            "DELETE FROM brief_topics WHERE brief_id = ?", (row[0],)
+        )
+        if brief.source_topics:
+            await self._connection.executemany(_SQL_INSERT_BRIEF_TOPIC, [
+                (row[0], topic.id, i)
+                for i, topic in enumerate(brief.source_topics)
+            ])
+        return row[0]
+
+    async def save_briefs(self, briefs: list[ContentBrief]) -> int:
+        """Save multiple content briefs in a single transaction"""
+        if not briefs:
+            return 0
+
+        rows = [self._brief_to_row(brief) for brief in briefs]
+        await self._connection.executemany(_SQL_INSERT_BRIEF, rows)
+        await self._connection.executemany(
+            "DELETE FROM brief_topics WHERE brief_id = ?",
+            [(row[0],) for row in rows],
+        )
+        junction = [
+            (row[0], topic.id, i)
+            for row, brief in zip(rows, briefs)
+            for i, topic in enumerate(brief.source_topics)
+        ]
+        if junction:
+            await self._connection.executemany(_SQL_INSERT_BRIEF_TOPIC, junction)
         await self._connection.commit()
-        return brief_id
+        return len(briefs)
 
     async def get_briefs(
         self,
@@ -286,76 +681,116 @@ class Storage:
         category: Optional[ContentCategory] = None,
     ) -> list[ContentBrief]:
         """Get content briefs with optional filters"""
-        query = "SELECT * FROM content_briefs"
+        query = _briefs_query(category is not None)
         params = []
 
         if category:
-            query += " WHERE category = ?"
             params.append(category.value)
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with self._connection.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            briefs = []
-            for row in rows:
-                brief = ContentBrief(
-                    id=row["id"],
-                    title=row["title"],
-                    hook=row["hook"],
-                    outline=json.loads(row["outline"]),
-                    suggested_format=row["suggested_format"],
-                    estimated_word_count=row["estimated_word_count"],
-                    target_keywords=json.loads(row["target_keywords"]) if row["target_keywords"] else [],
-                    meta_description=row["meta_description"],
-                    suggested_title_variants=json.loads(row["suggested_title_variants"]) if row["suggested_title_variants"] else [],
-                    category=ContentCategory(row["category"]),
-                    urgency=row["urgency"],
-                    notes=row["notes"],
-                    competitors=json.loads(row["competitors"]) if row["competitors"] else [],
-                )
-                briefs.append(brief)
-            return briefs
+        async with self._read() as conn:
+            async with conn.execute(query, params) as cursor:
+                return [self._row_to_brief(row) async for row in cursor]
 
-    async def get_stats(self) -> dict:
-        """Get database statistics"""
-        stats = {}
+    async def get_briefs_for_topic(self, topic_id: str) -> list[ContentBrief]:
+        """Get briefs citing a topic, joined through the junction table"""
+        async with self._read() as conn:
+            async with conn.execute(_SQL_BRIEFS_FOR_TOPIC, (topic_id,)) as cursor:
+                return [self._row_to_brief(row) async for row in cursor]
+
+    def _row_to_brief(self, row: aiosqlite.Row) -> ContentBrief:
+        """Convert database row to ContentBrief"""
+        return ContentBrief(
+            id=row["id"],
+            title=row["title"],
+            hook=row["hook"],
+            outline=orjson.loads(row["outline"]),
+            suggested_format=row["suggested_format"],
+            estimated_word_count=row["estimated_word_count"],
+            target_keywords=orjson.loads(row["target_keywords"]) if row["target_keywords"] else [],
+            meta_description=row["meta_description"],
+            suggested_title_variants=orjson.loads(row["suggested_title_variants"]) if row["suggested_title_variants"] else [],
+            category=_CATEGORY_BY_VALUE[row["category"]],
+            urgency=row["urgency"],
+            notes=row["notes"],
+            competitors=orjson.loads(row["competitors"]) if row["competitors"] else [],
+        )
+
+    async def pipeline(self, ops: list[tuple[str, tuple]]) -> list:
+        """Run several small read queries in one worker-thread dispatch.
 
-        async with self._connection.execute("SELECT COUNT(*) FROM topics") as cursor:
-            row = await cursor.fetchone()
-            stats["total_topics"] = row[0]
+        Every aiosqlite call hops to the connection's worker thread and
+        back; for tiny statements the hop costs more than the SQL. This
+        packs the whole list into a single callable run on a pooled read
+        connection, returning the fetched rows per statement. _execute is
+        aiosqlite's internal dispatch, but it is the only way to run a
+        Python callable on the connection's own thread.
+        """
+        def run_all(raw):
+            return [raw.execute(sql, params).fetchall() for sql, params in ops]
 
-        async with self._connection.execute("SELECT COUNT(*) FROM topics WHERE saved = 1") as cursor:
-            row = await cursor.fetchone()
-            stats["saved_topics"] = row[0]
+        async with self._read() as conn:
+            return await conn._execute(run_all, conn._conn)
 
-        async with self._connection.execute("SELECT COUNT(*) FROM content_briefs") as cursor:
-            row = await cursor.fetchone()
-            stats["total_briefs"] = row[0]
+    async def get_stats(self) -> dict:
+        """Get database statistics.
 
-        async with self._connection.execute("""
-            SELECT source, COUNT(*) as count FROM topics GROUP BY source
-        """) as cursor:
-            rows = await cursor.fetchall()
-            stats["topics_by_source"] = {row["source"]: row["count"] for row in rows}
+        The scalar counts ride one compound SELECT and both GROUP BYs share
+        one UNION ALL demuxed by its kind column; pipeline() then runs both
+        statements in a single worker-thread hop.
+        """
+        counts, groups = await self.pipeline([
+            ("""
+                SELECT (SELECT COUNT(*) FROM topics),
+                       (SELECT COUNT(*) FROM topics WHERE saved = 1),
+                       (SELECT COUNT(*) FROM content_briefs)
+            """, ()),
+            ("""
+                SELECT 'source' AS kind, source AS key, COUNT(*) AS count
+                FROM topics GROUP BY source
+                UNION ALL
+                SELECT 'category', category, COUNT(*)
+                FROM topics GROUP BY category
+            """, ()),
+        ])
+
+        row = counts[0]
+        stats = {
+            "total_topics": row[0],
+            "saved_topics": row[1],
+            "total_briefs": row[2],
+        }
 
-        async with self._connection.execute("""
-            SELECT category, COUNT(*) as count FROM topics GROUP BY category
-        """) as cursor:
-            rows = await cursor.fetchall()
-            stats["topics_by_category"] = {row["category"]: row["count"] for row in rows}
+        by_source: dict = {}
+        by_category: dict = {}
+        for row in groups:
+            target = by_source if row["kind"] == "source" else by_category
+            target[row["key"]] = row["count"]
 
+        stats["topics_by_source"] = by_source
+        stats["topics_by_category"] = by_category
         return stats
 
     async def cleanup_old_topics(self, days: int = 30) -> int:
-        """Remove topics older than specified days (keeps saved ones)"""
-        result = await self._connection.execute("""
-            DELETE FROM topics
-            WHERE saved = 0
-            AND datetime(discovered_at) < datetime('now', ?)
-        """, (f"-{days} days",))
+        """Remove topics older than specified days (keeps saved ones).
+
+        The cutoff is computed in Python and compared as TEXT: discovered_at
+        is written via isoformat(), which sorts lexicographically, so the
+        delete walks the saved=0 partial index instead of calling datetime()
+        on every stored row.
+        """
+        self._topic_cache.clear()
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        result = await self._connection.execute(
+            "DELETE FROM topics WHERE saved = 0 AND discovered_at < ?",
+            (cutoff,),
+        )
         await self._connection.commit()
+
+        # A big purge can skew the statistics the planner relies on
+        if result.rowcount > 1000:
+            await self._connection.execute("PRAGMA optimize")
         return result.rowcount
 
     async def __aenter__(self):